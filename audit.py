@@ -0,0 +1,183 @@
+import argparse
+import json
+import mmap
+import os
+import sys
+from collections import Counter
+from itertools import compress
+
+import strength
+
+# Bytes scanned per window; memory stays bounded by this however big the file is
+WINDOW_BYTES = 16 << 20
+
+# Band given to passwords found on the blocklist
+BREACHED_BAND = strength.BREACHED.band
+
+# Class bit marking a trailing carriage return, so CRLF files score like LF ones
+_CR = 32
+
+
+def _build_class_table():
+    # Each byte maps to its strength class bit; the newline maps to 0 so the
+    # translated window splits into exactly the same lines as the original
+    table = bytearray(256)
+    for b in range(256):
+        table[b] = strength._char_class(chr(b)) if b < 128 else strength.OTHER
+    table[ord("\n")] = 0
+    table[ord("\r")] = _CR
+    return bytes(table)
+
+
+CLASS_TABLE = _build_class_table()
+
+
+def _band_for_key(key):
+    classes, length = key
+    if classes & _CR:
+        classes &= ~_CR
+        length -= 1
+    return strength.band_for_score(
+        strength.score_from_entropy(strength.class_entropy(classes, length)))
+
+
+def _is_blank(key):
+    return key[1] == 0 or key == (_CR, 1)
+
+
+def scan_buffer(data, bands, flag_bands, blocklist=None):
+    # Classify every line of `data` without a Python-level loop over
+    # characters or lines: translate once, then map C builtins over the lines.
+    # Returns the band histogram, the list of flagged lines and the number of
+    # lines found on the blocklist, which are rated Weak whatever their makeup.
+    lines = data.split(b"\n")
+    classes = data.translate(CLASS_TABLE).split(b"\0")
+    keys = list(zip(map(sum, map(set, classes)), map(len, lines)))
+
+    histogram = Counter()
+    flagged_keys = set()
+    for key, count in Counter(keys).items():
+        if _is_blank(key):
+            continue
+        band = bands.get(key)
+        if band is None:
+            band = bands[key] = _band_for_key(key)
+        histogram[band] += count
+        if band in flag_bands:
+            flagged_keys.add(key)
+
+    mask = None
+    if flagged_keys:
+        mask = list(map(flagged_keys.__contains__, keys))
+
+    breached = 0
+    if blocklist is not None:
+        passwords = lines if b"\r" not in data else [
+            line[:-1] if line.endswith(b"\r") else line for line in lines]
+        weak = BREACHED_BAND in flag_bands
+        if weak and mask is None:
+            mask = [False] * len(lines)
+        # Hits are rare, so only they go through a Python-level loop
+        for i in compress(range(len(lines)), blocklist.flags(passwords)):
+            key = keys[i]
+            if _is_blank(key):
+                continue
+            breached += 1
+            histogram[bands[key]] -= 1
+            histogram[BREACHED_BAND] += 1
+            if weak:
+                mask[i] = True
+
+    flagged = list(compress(lines, mask)) if mask is not None else []
+    return histogram, flagged, breached
+
+
+def iter_windows(path, window=WINDOW_BYTES):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = min(start + window, size)
+                if end < size:
+                    # Cut on the last newline so no line spans two windows
+                    cut = mm.rfind(b"\n", start, end)
+                    if cut != -1:
+                        end = cut
+                yield mm[start:end]
+                start = end + 1 if end < size else end
+
+
+def audit_file(path, flagged_out=None, flag_bands=("Weak",), window=WINDOW_BYTES,
+               blocklist=None):
+    # Returns the band histogram and how many lines were on the blocklist
+    histogram = Counter({band: 0 for band in strength.BANDS})
+    bands = {}
+    breached = 0
+    flag_bands = frozenset(flag_bands)
+    for data in iter_windows(path, window):
+        counts, flagged, hits = scan_buffer(data, bands, flag_bands, blocklist)
+        histogram.update(counts)
+        breached += hits
+        if flagged and flagged_out is not None:
+            flagged_out.write(b"\n".join(flagged) + b"\n")
+    return histogram, breached
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="password-generator audit",
+        description="Score a newline-delimited password file against the strength bands.")
+    parser.add_argument("path", help="file with one password per line")
+    parser.add_argument("--flag", action="append", choices=strength.BANDS,
+                        help="band to flag (repeatable, default: Weak)")
+    parser.add_argument("--flagged-output",
+                        help="write flagged passwords to this file ('-' for stdout)")
+    parser.add_argument("--blocklist", metavar="PATH",
+                        help="compiled blocklist; passwords on it are rated Weak "
+                             "(default: the installed blocklist, if any)")
+    parser.add_argument("--no-blocklist", action="store_true",
+                        help="skip the blocklist check")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    blocked = None
+    if not args.no_blocklist:
+        import blocklist
+        try:
+            blocked = (blocklist.Blocklist(args.blocklist) if args.blocklist
+                       else blocklist.open_default())
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    flagged_out = None
+    if args.flagged_output == "-":
+        flagged_out = sys.stdout.buffer
+    elif args.flagged_output:
+        flagged_out = open(args.flagged_output, "wb", buffering=1 << 20)
+
+    try:
+        histogram, breached = audit_file(args.path, flagged_out, args.flag or ("Weak",),
+                                         blocklist=blocked)
+    finally:
+        if flagged_out is not None and flagged_out is not sys.stdout.buffer:
+            flagged_out.close()
+        if blocked is not None:
+            blocked.close()
+
+    report = {"total": sum(histogram.values()), "bands": dict(histogram)}
+    if blocked is not None:
+        report["breached"] = breached
+    print(json.dumps(report), file=sys.stderr if flagged_out is sys.stdout.buffer else sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audit
+import blocklist
+import generator
+
+
+def synthetic_corpus(directory, count):
+    # Plain 10-character passwords stand in for a breached-password dump
+    source = os.path.join(directory, "corpus.txt")
+    with open(source, "wb") as f:
+        remaining = count
+        while remaining > 0:
+            n = min(remaining, 1 << 20)
+            f.write(generator.generate_lines(n, 10))
+            remaining -= n
+    return source
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blocklist open/lookup/bulk-check costs")
+    parser.add_argument("--blocklist", help="compiled blocklist (default: synthetic)")
+    parser.add_argument("--entries", type=int, default=5000000,
+                        help="size of the synthetic blocklist")
+    parser.add_argument("--count", type=int, default=1000000,
+                        help="passwords checked")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.blocklist
+        if path is None:
+            path = os.path.join(tmp, "blocklist.pwbl")
+            source = synthetic_corpus(tmp, args.entries)
+            start = time.perf_counter()
+            blocklist.compile_blocklist(source, path)
+            print(f"compile {args.entries:,} entries: {time.perf_counter() - start:8.2f} s")
+
+        start = time.perf_counter()
+        blocked = blocklist.Blocklist(path)
+        print(f"open blocklist:        {(time.perf_counter() - start) * 1e6:8.1f} us "
+              f"({len(blocked):,} entries)")
+
+        passwords = generator.generate_batch(args.count, 16)
+        start = time.perf_counter()
+        for password in passwords:
+            password in blocked
+        print(f"single lookup:         {(time.perf_counter() - start) / args.count * 1e6:8.2f} us")
+
+        lines = [p.encode("ascii") for p in passwords]
+        start = time.perf_counter()
+        hits = sum(blocked.flags(lines))
+        rate = args.count / (time.perf_counter() - start)
+        print(f"bulk check:            {rate:12,.0f} passwords/sec ({hits} hits)")
+
+        audited = os.path.join(tmp, "audit.txt")
+        with open(audited, "wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+        start = time.perf_counter()
+        audit.audit_file(audited, blocklist=blocked)
+        rate = args.count / (time.perf_counter() - start)
+        print(f"audit with blocklist:  {rate:12,.0f} passwords/sec")
+        blocked.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+import gui
+
+
+def settle(app, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def run(app, window, clicks, rapid):
+    window.rapid_mode.setChecked(rapid)
+    settle(app, 0.2)  # let the pool fill
+    window.click_latency.reset()
+    for _ in range(clicks):
+        window.generate_button.click()
+        # Process events until the field has been painted
+        while window.click_started is not None:
+            app.processEvents()
+    return window.click_latency
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate-button click-to-paint latency")
+    parser.add_argument("--clicks", type=int, default=1000)
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="print summaries as JSON")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = gui.PasswordGenerator()
+    window.length_slider.setValue(args.length)
+    window.show()
+    settle(app, 0.1)
+
+    results = {}
+    for rapid in (False, True):
+        name = "rapid-fire" if rapid else "direct"
+        histogram = run(app, window, args.clicks, rapid)
+        results[name] = histogram.summary()
+        if not args.json:
+            summary = results[name]
+            print(f"{name}: mean={summary['mean_us']:.0f} us p50<={summary['p50_us']:.0f} us "
+                  f"p99<={summary['p99_us']:.0f} us max={summary['max_us']:.0f} us")
+            print(histogram.format())
+    window.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
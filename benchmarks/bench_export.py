@@ -0,0 +1,55 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import export
+import generator
+
+
+def write_usernames(path, count):
+    with open(path, "w") as f:
+        for start in range(0, count, 100000):
+            f.write("".join(f"user{i}@example.com\n"
+                            for i in range(start, min(count, start + 100000))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming export throughput and peak memory")
+    parser.add_argument("--rows", type=int, default=2000000)
+    parser.add_argument("--memory", action="store_true",
+                        help="also report peak traced memory (slow)")
+    parser.add_argument("--key-file", help="also time encrypted output with this Fernet key")
+    args = parser.parse_args()
+
+    make_passwords = lambda n: generator.generate_batch(n, 16)
+    runs = [(fmt, None) for fmt in sorted(export.FORMATS)]
+    if args.key_file:
+        runs += [(fmt + "+encrypted", export.read_key(args.key_file))
+                 for fmt in sorted(export.FORMATS)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "usernames.txt")
+        write_usernames(source, args.rows)
+        for name, key in runs:
+            out = os.path.join(tmp, "export.out")
+            start = time.perf_counter()
+            rows = export.export(source, out, name.split("+")[0], make_passwords, key)
+            elapsed = time.perf_counter() - start
+            line = (f"{name:<16} {rows / elapsed:10,.0f} rows/sec  "
+                    f"{os.path.getsize(out) / elapsed / 1e6:6.1f} MB/s")
+            if args.memory:
+                # Separate run: tracing slows everything down several times
+                tracemalloc.start()
+                export.export(source, out, name.split("+")[0], make_passwords, key)
+                line += f"  peak {tracemalloc.get_traced_memory()[1] / 1e6:5.1f} MB"
+                tracemalloc.stop()
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generator
+
+LENGTHS = [8, 16, 32, 64, 128, 256]
+
+
+def per_char(n, length, policy):
+    # The original GUI path: one random.choice call per character
+    chars = generator.build_alphabet(policy)
+    return ["".join(random.choice(chars) for _ in range(length)) for _ in range(n)]
+
+
+METHODS = {
+    "per-char": per_char,
+    "random": lambda n, length, policy: generator.generate_batch(n, length, policy, method="random"),
+    "secure": lambda n, length, policy: generator.generate_batch(n, length, policy, method="secure"),
+}
+
+
+def bench(fn, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(count)
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Password generation throughput")
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--length", type=int, action="append",
+                        help="password length (repeatable, default: 8-256 sweep)")
+    parser.add_argument("--method", choices=sorted(METHODS), action="append")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    policy = generator.DEFAULT_POLICY
+    for length in args.length or LENGTHS:
+        # Keep the amount of generated characters roughly constant per length
+        count = max(1, args.count * 16 // length)
+        for name in args.method or ["per-char", "random", "secure"]:
+            fn = METHODS[name]
+            rate = bench(lambda n: fn(n, length, policy), count, args.repeat)
+            print(f"{name:<9} length={length:<4} {rate:>14,.0f} passwords/sec")
+
+
+if __name__ == '__main__':
+    main()
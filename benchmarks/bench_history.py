@@ -0,0 +1,57 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generator
+import history
+
+
+def bench_dedupe(count, length):
+    # Bulk path: newline-terminated chunks through the fingerprint index
+    index = history.FingerprintSet()
+    start = time.perf_counter()
+    emitted = 0
+    for chunk in history.iter_unique_chunks(
+            count, lambda n: (generator.generate_lines(min(n - i, 65536), length)
+                              for i in range(0, n, 65536)), index):
+        emitted += chunk.count(b"\n")
+    elapsed = time.perf_counter() - start
+    print(f"dedupe {emitted:,} x {length}-char: {emitted / elapsed:12,.0f} passwords/sec, "
+          f"index {index.memory_bytes() / len(index):.1f} bytes/entry")
+
+
+def bench_store(count, length):
+    passwords = generator.generate_batch(count, length)
+    tracemalloc.start()
+    store = history.PasswordHistory(limit=count)
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for password in passwords:
+        store.append(password)
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(f"history store {count:,} x {length}-char: {count / elapsed:12,.0f} appends/sec, "
+          f"{used / count:.1f} bytes/entry measured "
+          f"({store.memory_bytes() / count:.1f} reported)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="History store and dedupe index costs")
+    parser.add_argument("--count", type=int, default=10000000,
+                        help="passwords pushed through the dedupe index")
+    parser.add_argument("--store-count", type=int, default=100000,
+                        help="entries appended to the session history")
+    parser.add_argument("--length", type=int, default=16)
+    args = parser.parse_args()
+
+    bench_store(args.store_count, args.length)
+    bench_dedupe(args.count, args.length)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that scripted callers import; none of them may pull in PyQt5
+HEADLESS_MODULES = ["generator", "strength", "parallel", "audit", "cli", "main"]
+
+PROBE = """
+import resource, sys
+import {modules}
+qt = sorted(m for m in sys.modules if m.split('.')[0] == 'PyQt5')
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+print(','.join(qt))
+"""
+
+
+def measure(modules):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(modules=", ".join(modules))],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(us)
+
+    rss_kb, qt = result.stdout.splitlines()[-2:]
+    total_us = sum(cumulative.get(m, 0) for m in modules)
+    return total_us / 1000, int(rss_kb) / 1024, [m for m in qt.split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget for the headless modules")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="fail when the headless imports take longer than this")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [measure(HEADLESS_MODULES) for _ in range(args.repeat)]
+    best_ms = min(ms for ms, _, _ in runs)
+    rss_mb = min(rss for _, rss, _ in runs)
+    qt = runs[0][2]
+
+    print(f"headless import: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms), "
+          f"max RSS {rss_mb:.1f} MB")
+    if qt:
+        print(f"FAIL: PyQt5 modules imported: {', '.join(qt)}")
+        sys.exit(1)
+    if best_ms > args.budget_ms:
+        print("FAIL: import budget exceeded")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
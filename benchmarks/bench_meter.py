@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+import gui
+
+
+def settle(app, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Strength meter paints during drags and clicks")
+    parser.add_argument("--clicks", type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = gui.PasswordGenerator()
+    window.show()
+    settle(app, 0.3)
+    meter = window.strength_meter
+
+    def report(name, run):
+        paints, skipped = meter.paint_count, meter.skipped_count
+        meter.paint_latency.reset()
+        run()
+        settle(app, 0.3)  # let the last transition finish
+        summary = meter.paint_latency.summary()
+        print(f"{name:<28} paints={meter.paint_count - paints:<5} "
+              f"skipped={meter.skipped_count - skipped:<5} "
+              f"mean paint={summary['mean_us']:.0f} us")
+
+    def drag():
+        for value in range(8, 257):
+            window.length_slider.setValue(value)
+            settle(app, 0.004)
+
+    def clicks():
+        for _ in range(args.clicks):
+            window.generate_button.click()
+            app.processEvents()
+
+    report("slider drag 8 -> 256", drag)
+    report(f"{args.clicks} clicks, same settings", clicks)
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
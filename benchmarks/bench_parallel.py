@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generator
+import parallel
+
+
+def run(count, length, workers):
+    start = time.perf_counter()
+    total = 0
+    for chunk in parallel.iter_chunks(count, length, generator.DEFAULT_POLICY, workers=workers):
+        total += len(chunk)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel bulk generation scaling")
+    parser.add_argument("--count", type=int, default=5000000)
+    parser.add_argument("--length", type=int, default=16)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        rate = run(args.count, args.length, workers)
+        baseline = baseline or rate
+        efficiency = rate / (baseline * workers)
+        print(f"workers={workers:<3} {rate:>14,.0f} passwords/sec  "
+              f"speedup={rate / baseline:.2f}x  efficiency={efficiency:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import passphrase
+
+
+def synthetic_wordlist(directory, count):
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    source = os.path.join(directory, "words.txt")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("\n".join(words) + "\n")
+    return source
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Passphrase wordlist open/lookup/batch costs")
+    parser.add_argument("--wordlist", help="compiled wordlist (default: synthetic)")
+    parser.add_argument("--words", type=int, default=300000,
+                        help="size of the synthetic wordlist")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.wordlist
+        if path is None:
+            path = os.path.join(tmp, "words.pwwl")
+            start = time.perf_counter()
+            passphrase.compile_wordlist(synthetic_wordlist(tmp, args.words), path)
+            print(f"compile {args.words} words:  {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        start = time.perf_counter()
+        wordlist = passphrase.Wordlist(path)
+        print(f"open wordlist:          {(time.perf_counter() - start) * 1e6:8.1f} us "
+              f"({len(wordlist)} words, {wordlist.bits_per_word:.2f} bits/word)")
+
+        indices = passphrase.random_indices(args.count, len(wordlist))
+        start = time.perf_counter()
+        for i in indices:
+            wordlist[i]
+        print(f"random lookup:          {(time.perf_counter() - start) / args.count * 1e9:8.1f} ns")
+
+        start = time.perf_counter()
+        passphrase.generate_batch(args.count, passphrase.DEFAULT_WORDS, wordlist)
+        rate = args.count / (time.perf_counter() - start)
+        print(f"batch of {passphrase.DEFAULT_WORDS}-word phrases: {rate:10,.0f} passphrases/sec")
+        wordlist.close()
+
+
+if __name__ == '__main__':
+    main()
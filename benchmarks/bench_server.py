@@ -0,0 +1,71 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics
+import server
+
+REQUEST = b"GET /password?length=16 HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+async def client(open_connection, requests, histogram):
+    # One keep-alive connection issuing requests back to back
+    reader, writer = await open_connection()
+    for _ in range(requests):
+        start = time.perf_counter()
+        writer.write(REQUEST)
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.split(b"Content-Length: ", 1)[1].split(b"\r\n", 1)[0])
+        await reader.readexactly(length)
+        histogram.record(time.perf_counter() - start)
+    writer.close()
+
+
+async def run(args):
+    service = server.PasswordService()
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.unix:
+            path = os.path.join(tmp, "passwords.sock")
+            listener = await server.start(service, unix=path)
+            open_connection = lambda: asyncio.open_unix_connection(path)
+        else:
+            listener = await server.start(service, port=0)
+            port = listener.sockets[0].getsockname()[1]
+            open_connection = lambda: asyncio.open_connection("127.0.0.1", port)
+
+        histogram = metrics.LatencyHistogram()
+        start = time.perf_counter()
+        await asyncio.gather(*(client(open_connection, args.requests, histogram)
+                               for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - start
+        listener.close()
+        await listener.wait_closed()
+
+    total = args.concurrency * args.requests
+    summary = histogram.summary()
+    print(f"{'unix' if args.unix else 'tcp'} concurrency={args.concurrency} requests={total}")
+    print(f"  throughput {total / elapsed:,.0f} req/s")
+    print(f"  latency mean={summary['mean_us']:.0f} us p50<={summary['p50_us']:.0f} us "
+          f"p99<={summary['p99_us']:.0f} us max={summary['max_us']:.0f} us")
+    print(f"  {service.batcher.requests / max(1, service.batcher.batches):.1f} "
+          f"requests per CSPRNG batch")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local load test of the password service (client and server in-process)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=500,
+                        help="requests per connection")
+    parser.add_argument("--unix", action="store_true", help="use a Unix socket instead of TCP")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
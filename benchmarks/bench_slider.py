@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+import gui
+
+
+def drag(app, window, start, stop, step_ms):
+    # Simulate a user dragging the slider one value per step_ms
+    slider = window.length_slider
+    slider.setValue(start)
+    wait(app, gui.FRAME_INTERVAL_MS * 2)
+    window.reset_ui_counters()
+
+    step = 1 if stop >= start else -1
+    began = time.perf_counter()
+    for value in range(start + step, stop + step, step):
+        slider.setValue(value)
+        wait(app, step_ms)
+    wait(app, gui.FRAME_INTERVAL_MS * 2)
+    return time.perf_counter() - began
+
+
+def wait(app, ms):
+    deadline = time.perf_counter() + ms / 1000
+    while True:
+        app.processEvents()
+        if time.perf_counter() >= deadline:
+            return
+        time.sleep(0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slider drag recompute/restyle counts")
+    parser.add_argument("--step-ms", type=float, default=4.0,
+                        help="time between slider ticks during the simulated drag")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = gui.PasswordGenerator()
+    window.show()
+
+    for start, stop in ((8, 256), (256, 8)):
+        elapsed = drag(app, window, start, stop, args.step_ms)
+        counters = window.ui_counters
+        print(f"drag {start:>3} -> {stop:<3} ticks={abs(stop - start):<4} "
+              f"recompute={counters['strength_recompute']:<4} "
+              f"restyle={counters['label_restyle']:<3} {elapsed * 1000:.0f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QPushButton
+
+import gui
+
+ROLES = ("outline", "success")
+
+
+def legacy_button_sheet(role):
+    # How the copy button used to be restyled: a fresh f-string per click,
+    # parsed by Qt for this one widget
+    color, text, border = {
+        "outline": ("transparent", "#6200EE", "1px solid #6200EE"),
+        "success": ("#4CAF50", "white", "none"),
+    }[role]
+    return f"""
+    QPushButton {{
+        background-color: {color};
+        color: {text};
+        border: {border};
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {color}DD;
+    }}
+    QPushButton:pressed {{
+        background-color: {color}AA;
+    }}
+    """
+
+
+def time_first_paint(app):
+    start = time.perf_counter()
+    window = gui.PasswordGenerator()
+    window.show()
+    app.processEvents()
+    window.grab()  # forces a full paint of the window
+    return time.perf_counter() - start, window
+
+
+def time_per_call(fn, count):
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stylesheet/theme costs")
+    parser.add_argument("--clicks", type=int, default=500)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    first_paint, window = time_first_paint(app)
+    print(f"time to first paint:           {first_paint * 1000:8.1f} ms")
+
+    def click(_):
+        window.generate_password()
+        app.processEvents()
+
+    print(f"generate_password click:       {time_per_call(click, args.clicks) * 1e6:8.1f} us")
+
+    # Cost of flipping a button between its normal and "copied" look
+    legacy = QPushButton("Copy to Clipboard")
+    legacy.show()
+    themed = QPushButton("Copy to Clipboard")
+    themed.show()
+
+    def legacy_restyle(i):
+        legacy.setStyleSheet(legacy_button_sheet(ROLES[i % 2]))
+        legacy.grab()
+
+    def themed_restyle(i):
+        gui.StyleHelper.set_property(themed, "role", ROLES[i % 2])
+        themed.grab()
+
+    print(f"restyle, per-widget sheet:     {time_per_call(legacy_restyle, args.clicks) * 1e6:8.1f} us")
+    print(f"restyle, dynamic property:     {time_per_call(themed_restyle, args.clicks) * 1e6:8.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+import gui
+
+
+def settle(app, seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def object_counts(window):
+    gc.collect()
+    return len(window.findChildren(QTimer)), len(gc.get_objects())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rapid copies keep a constant object count; auto-clear only clears our text")
+    parser.add_argument("--copies", type=int, default=10000)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    window = gui.PasswordGenerator()
+    window.show()
+    settle(app, 0.1)
+    clipboard = QApplication.clipboard()
+    ok = True
+
+    window.copy_password()
+    app.processEvents()
+    timers, objects = object_counts(window)
+    for _ in range(args.copies):
+        window.copy_password()
+        app.processEvents()
+    after_timers, after_objects = object_counts(window)
+    print(f"{args.copies} copies: QTimers {timers} -> {after_timers}, "
+          f"Python objects {objects} -> {after_objects}")
+    ok &= after_timers == timers and after_objects - objects < 100
+
+    # Auto-clear: our password goes, anything the user copied since stays
+    window.clipboard.clear_after_ms = 200
+    window.copy_password()
+    settle(app, 0.4)
+    cleared = clipboard.text() == ""
+    window.copy_password()
+    clipboard.setText("not ours")
+    settle(app, 0.4)
+    kept = clipboard.text() == "not ours"
+    print(f"auto-clear removes our password: {cleared}, leaves other text: {kept}")
+    ok &= cleared and kept
+
+    # Copy feedback ends once, whatever the number of copies before it
+    resets = []
+    window.clipboard.reset.connect(lambda: resets.append(1))
+    for _ in range(100):
+        window.copy_password()
+    settle(app, gui.COPY_FEEDBACK_MS / 1000 + 0.2)
+    print(f"100 copies -> {len(resets)} button reset(s), text {window.copy_button.text()!r}")
+    ok &= len(resets) == 1 and window.copy_button.text() == window.copy_text
+
+    window.generate_password()
+    window.copy_history()
+    lines = clipboard.text().splitlines()
+    print(f"batch copy: {len(lines)} passwords in one clipboard write")
+    ok &= lines == window.history.store.recent()
+
+    window.close()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
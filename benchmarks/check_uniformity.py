@@ -0,0 +1,45 @@
+import argparse
+import math
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generator
+
+
+def chi_square_critical(dof, z=3.09):
+    # Wilson-Hilferty approximation of the chi-square quantile (z=3.09 -> p=0.001)
+    return dof * (1 - 2 / (9 * dof) + z * math.sqrt(2 / (9 * dof))) ** 3
+
+
+def check(policy, samples):
+    alphabet = generator.build_alphabet(policy)
+    counts = Counter(generator.sample_bytes(samples, alphabet))
+    expected = samples / len(alphabet)
+    stat = sum((counts.get(c, 0) - expected) ** 2 / expected for c in alphabet.encode("ascii"))
+    dof = len(alphabet) - 1
+    return stat, chi_square_critical(dof) if dof else 0.0, set(counts) <= set(alphabet.encode("ascii"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chi-square uniformity check of the secure sampler")
+    parser.add_argument("--samples", type=int, default=2000000)
+    args = parser.parse_args()
+
+    failed = False
+    for bits in range(1, 32):
+        policy = generator.Policy(*(bool(bits >> i & 1) for i in range(5)))
+        if not generator.build_alphabet(policy):
+            continue
+        stat, critical, in_alphabet = check(policy, args.samples)
+        ok = in_alphabet and stat <= critical
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {policy}  chi2={stat:.1f} critical={critical:.1f}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
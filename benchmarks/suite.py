@@ -0,0 +1,198 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import audit
+import generator
+import strength
+
+# Usage:
+#   python benchmarks/suite.py --save baseline.json
+#   ... change things ...
+#   python benchmarks/suite.py --compare baseline.json   (exit status 1 on regression)
+# Metrics named *.per_sec are better when higher; everything else (times) when lower.
+
+
+def best_rate(fn, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def record_spread(results, prefix, samples):
+    # Exact median and p90 in microseconds; the median is what a gate can trust
+    # on a noisy machine, the p90 catches the occasional slow path
+    results[f"{prefix}.median_us"] = statistics.median(samples) * 1e6
+    results[f"{prefix}.p90_us"] = statistics.quantiles(samples, n=10)[-1] * 1e6
+
+
+def policy_name(policy):
+    return "+".join(field for field, on in zip(policy._fields, policy) if on) or "none"
+
+
+def bench_generation(results, args):
+    for length in range(generator.MIN_LENGTH, generator.MAX_LENGTH + 1, args.length_step):
+        results[f"generate.length.{length}.per_sec"] = best_rate(
+            lambda: generator.generate_batch(args.count, length), args.count, args.repeat)
+    for policy in strength.ALL_POLICIES:
+        if not generator.build_alphabet(policy):
+            continue  # no character class selected: nothing to generate
+        results[f"generate.policy.{policy_name(policy)}.per_sec"] = best_rate(
+            lambda: generator.generate_batch(args.count, 16, policy), args.count, args.repeat)
+    results["generate.lines.16.per_sec"] = best_rate(
+        lambda: generator.generate_lines(args.count * 10, 16), args.count * 10, args.repeat)
+
+
+def bench_strength(results, args):
+    policies = [(p, length) for p in strength.ALL_POLICIES
+                for length in range(generator.MIN_LENGTH, generator.MAX_LENGTH + 1)]
+    strength.policy_strength(generator.DEFAULT_POLICY, 16)  # build the table up front
+    results["strength.policy_lookup.per_sec"] = best_rate(
+        lambda: [strength.policy_strength(p, length) for p, length in policies],
+        len(policies), args.repeat)
+
+    passwords = generator.generate_batch(args.count, 16)
+    results["strength.score_password.per_sec"] = best_rate(
+        lambda: list(map(strength.score_password, passwords)), len(passwords), args.repeat)
+
+    data = generator.generate_lines(args.count * 10, 16)
+    results["strength.audit_scan.per_sec"] = best_rate(
+        lambda: audit.scan_buffer(data, {}, frozenset(("Weak",))), args.count * 10, args.repeat)
+
+
+def bench_gui(results, args):
+    from PyQt5.QtWidgets import QApplication
+    import gui
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    def settle(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            app.processEvents()
+
+    # Window construction, best of a few so one-off caches do not dominate
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        window = gui.PasswordGenerator()
+        best = min(best, time.perf_counter() - start)
+        window.close()
+        window.deleteLater()
+        settle(0.05)
+    results["gui.construct_ms"] = best * 1e3
+
+    window = gui.PasswordGenerator()
+    window.show()
+    settle(0.1)
+
+    # Click-to-paint latency of the Generate button
+    clicks = []
+    for _ in range(args.clicks):
+        start = time.perf_counter()
+        window.generate_button.click()
+        while window.click_started is not None:
+            app.processEvents()
+        clicks.append(time.perf_counter() - start)
+    record_spread(results, "gui.click", clicks)
+
+    # Slider drag: one tick per frame, timing the work done for each frame
+    frames = []
+    slider = window.length_slider
+    slider.setValue(generator.MIN_LENGTH)
+    settle(0.05)
+    for value in range(generator.MIN_LENGTH + 1, generator.MAX_LENGTH + 1):
+        start = time.perf_counter()
+        slider.setValue(value)
+        app.processEvents()
+        ticked = time.perf_counter()
+        time.sleep(gui.FRAME_INTERVAL_MS / 1000)
+        frame = time.perf_counter()
+        app.processEvents()  # the throttled strength update lands here
+        frames.append((ticked - start) + (time.perf_counter() - frame))
+    record_spread(results, "gui.slider_frame", frames)
+    window.close()
+
+
+def higher_is_better(name):
+    return name.endswith(".per_sec")
+
+
+def compare(results, baseline, tolerance):
+    # Returns the names of the metrics that got worse by more than `tolerance`
+    regressions = []
+    for name, value in results.items():
+        old = baseline.get(name)
+        if not old:
+            print(f"{name:<72} {value:>14,.1f}  (no baseline)")
+            continue
+        change = (value - old) / old
+        worse = -change if higher_is_better(name) else change
+        flag = "REGRESSION" if worse > tolerance else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<72} {value:>14,.1f} {old:>14,.1f} {change:+8.1%} {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generation, scoring and GUI responsiveness benchmarks with JSON baselines")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="passwords per generation/scoring run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best wins)")
+    parser.add_argument("--length-step", type=int, default=8,
+                        help="step of the 8-256 length sweep (1 for every length)")
+    parser.add_argument("--clicks", type=int, default=300)
+    parser.add_argument("--no-gui", action="store_true", help="skip the offscreen Qt benchmarks")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="relative slowdown counted as a regression (default: 0.15)")
+    args = parser.parse_args()
+
+    results = {}
+    bench_generation(results, args)
+    bench_strength(results, args)
+    if not args.no_gui:
+        try:
+            bench_gui(results, args)
+        except ImportError as e:
+            print(f"skipping GUI benchmarks: {e}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.tolerance)
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%} "
+              f"against {args.compare} ({baseline['meta']['timestamp']})")
+    else:
+        for name, value in results.items():
+            print(f"{name:<72} {value:>14,.1f}")
+        regressions = []
+
+    if args.save:
+        meta = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        }
+        with open(args.save, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+            f.write("\n")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
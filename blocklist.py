@@ -0,0 +1,230 @@
+import argparse
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from hashlib import sha1
+from itertools import repeat
+from operator import eq, methodcaller, rshift
+
+# Compiled blocklist layout (all integers little-endian uint64):
+#   MAGIC | count | buckets[BUCKETS + 1] | keys[count], sorted and distinct
+# A key is the first 8 bytes of the password's SHA-1, the hash breached-password
+# corpora are published in. buckets[p] is the index of the first key whose top
+# 16 bits are >= p, so a lookup bisects a slice of about count / 65536 keys
+# straight out of the memory map and opening a list costs one mmap call.
+MAGIC = b"PWBL\x01\x00\x00\x00"
+_COUNT = struct.Struct("<Q")
+PREFIX_BITS = 16
+BUCKETS = 1 << PREFIX_BITS
+HEADER_SIZE = len(MAGIC) + _COUNT.size + 8 * (BUCKETS + 1)
+
+# Keys sorted in memory at a time while compiling; larger lists go through
+# sorted runs in temporary files, so compiling never holds the whole corpus
+RUN_KEYS = 1 << 21
+
+# Looked up when no blocklist path is given
+BLOCKLIST_ENV = "PASSWORD_GENERATOR_BLOCKLIST"
+DEFAULT_BLOCKLIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blocklist.pwbl")
+
+_HEX = frozenset(b"0123456789abcdefABCDEF")
+
+
+def password_key(password):
+    if isinstance(password, str):
+        password = password.encode("utf-8")
+    return int.from_bytes(sha1(password).digest()[:8], "big")
+
+
+class Blocklist:
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("compiled blocklists can only be read on little-endian hosts")
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is not a compiled blocklist") from None
+        if self._mm[:len(MAGIC)] != MAGIC or len(self._mm) < HEADER_SIZE:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compiled blocklist")
+        self.count = _COUNT.unpack_from(self._mm, len(MAGIC))[0]
+        view = memoryview(self._mm)
+        self._buckets = view[len(MAGIC) + _COUNT.size:HEADER_SIZE].cast("Q")
+        self._keys = view[HEADER_SIZE:HEADER_SIZE + 8 * self.count].cast("Q")
+        view.release()
+
+    def __len__(self):
+        return self.count
+
+    def contains_key(self, key):
+        prefix = key >> (64 - PREFIX_BITS)
+        hi = self._buckets[prefix + 1]
+        i = bisect_left(self._keys, key, self._buckets[prefix], hi)
+        return i < hi and self._keys[i] == key
+
+    def __contains__(self, password):
+        return self.contains_key(password_key(password))
+
+    def flags(self, passwords):
+        # One bool per password (bytes), in order. The same lookup as
+        # contains_key, spelled as maps over C callables so a bulk audit never
+        # enters a Python frame per password.
+        if not self.count:
+            return repeat(False, len(passwords))
+        digests = map(methodcaller("digest"), map(sha1, passwords))
+        keys = list(map(rshift, map(int.from_bytes, digests, repeat("big")), repeat(96)))
+        prefixes = list(map(rshift, keys, repeat(64 - PREFIX_BITS)))
+        found = map(bisect_left, repeat(self._keys), keys,
+                    map(self._buckets.__getitem__, prefixes),
+                    map(self._buckets.__getitem__, map(int.__add__, prefixes, repeat(1))))
+        # Clamp so a miss past the last key still compares against a real one
+        found = map(min, found, repeat(self.count - 1))
+        return map(eq, map(self._keys.__getitem__, found), keys)
+
+    def close(self):
+        self._buckets.release()
+        self._keys.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse_line(line, fmt):
+    # Plain passwords are hashed; "sha1" lines are 40 hex digits, optionally
+    # followed by ":count" as in the published breach corpora
+    line = line.rstrip(b"\r\n")
+    if fmt == "plain":
+        return password_key(line) if line else None
+    digest = line.split(b":", 1)[0].strip()
+    if len(digest) == 40 and _HEX.issuperset(digest):
+        return int(digest[:16], 16)
+    if fmt == "sha1":
+        raise ValueError(f"not a SHA-1 line: {line[:60]!r}")
+    return password_key(line) if line else None
+
+
+def _write_run(keys, runs):
+    run = tempfile.TemporaryFile()
+    array("Q", sorted(keys)).tofile(run)
+    run.seek(0)
+    runs.append(run)
+
+
+def _read_run(run):
+    while True:
+        chunk = array("Q")
+        try:
+            chunk.fromfile(run, 1 << 16)
+        except EOFError:
+            pass
+        if not chunk:
+            return
+        yield from chunk
+
+
+def compile_blocklist(source, destination, fmt="auto"):
+    runs = []
+    try:
+        keys = array("Q")
+        with open(source, "rb") as f:
+            for line in f:
+                key = _parse_line(line, fmt)
+                if key is not None:
+                    keys.append(key)
+                if len(keys) >= RUN_KEYS:
+                    _write_run(keys, runs)
+                    keys = array("Q")
+        if keys or not runs:
+            _write_run(keys, runs)
+
+        buckets = array("Q", bytes(8 * (BUCKETS + 1)))
+        count = 0
+        last = None
+        out_keys = array("Q")
+        with open(destination, "wb") as out:
+            out.seek(HEADER_SIZE)
+            for key in heapq.merge(*map(_read_run, runs)):
+                if key == last:
+                    continue
+                last = key
+                buckets[(key >> (64 - PREFIX_BITS)) + 1] += 1
+                out_keys.append(key)
+                count += 1
+                if len(out_keys) >= 1 << 16:
+                    out_keys.tofile(out)
+                    out_keys = array("Q")
+            out_keys.tofile(out)
+
+            # Per-prefix counts to start offsets
+            for p in range(1, BUCKETS + 1):
+                buckets[p] += buckets[p - 1]
+            if sys.byteorder != "little":
+                buckets.byteswap()
+            out.seek(0)
+            out.write(MAGIC)
+            out.write(_COUNT.pack(count))
+            buckets.tofile(out)
+    finally:
+        for run in runs:
+            run.close()
+    return count
+
+
+def default_blocklist_path():
+    return os.environ.get(BLOCKLIST_ENV) or DEFAULT_BLOCKLIST
+
+
+def open_default():
+    # The blocklist is optional: None when no compiled list is installed
+    path = default_blocklist_path()
+    if not os.path.exists(path):
+        return None
+    return Blocklist(path)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "compile":
+        parser = argparse.ArgumentParser(prog="password-generator blocklist compile",
+                                         description="Compile a blocklist")
+        parser.add_argument("source", help="one password or SHA-1 hash (hex) per line")
+        parser.add_argument("destination", help="compiled blocklist to write")
+        parser.add_argument("--format", choices=("auto", "plain", "sha1"), default="auto",
+                            help="how to read SOURCE lines (default: auto)")
+        args = parser.parse_args(argv[1:])
+        try:
+            count = compile_blocklist(args.source, args.destination, args.format)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"{count} distinct entries", file=sys.stderr)
+        return 0
+
+    parser = argparse.ArgumentParser(
+        prog="password-generator blocklist",
+        description="Print the passwords read from stdin that are on the blocklist "
+                    "('blocklist compile SOURCE DEST' builds one).")
+    parser.add_argument("--blocklist", default=None,
+                        help=f"compiled blocklist (default: ${BLOCKLIST_ENV} or blocklist.pwbl)")
+    args = parser.parse_args(argv)
+    found = 0
+    with Blocklist(args.blocklist or default_blocklist_path()) as blocked:
+        for line in sys.stdin.buffer:
+            password = line.rstrip(b"\r\n")
+            if password and password in blocked:
+                sys.stdout.buffer.write(password + b"\n")
+                found += 1
+    return 1 if found else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import argparse
+import importlib
+import sys
+
+import generator
+import parallel
+
+WRITE_BUFFER = 1 << 20
+
+# Subcommands live in their own modules and are imported only when used
+COMMANDS = {
+    "audit": "audit",
+    "blocklist": "blocklist",
+    "export": "export",
+    "passphrase": "passphrase",
+    "profile": "profiling",
+    "serve": "server",
+}
+
+
+def add_policy_arguments(parser):
+    group = parser.add_argument_group("character options")
+    group.add_argument("--no-uppercase", dest="uppercase", action="store_false",
+                       help="exclude uppercase letters (A-Z)")
+    group.add_argument("--no-lowercase", dest="lowercase", action="store_false",
+                       help="exclude lowercase letters (a-z)")
+    group.add_argument("--no-numbers", dest="numbers", action="store_false",
+                       help="exclude numbers (0-9)")
+    group.add_argument("--no-special", dest="special", action="store_false",
+                       help="exclude special characters (!@#$%%^&*)")
+    group.add_argument("--avoid-similar", action="store_true",
+                       help="avoid similar characters (l, 1, I, 0, O)")
+
+
+def add_constraint_arguments(parser):
+    group = parser.add_argument_group(
+        "constraints", "placed directly, without regenerating until a password passes")
+    group.add_argument("--min-uppercase", type=int, default=0, metavar="N")
+    group.add_argument("--min-lowercase", type=int, default=0, metavar="N")
+    group.add_argument("--min-numbers", type=int, default=0, metavar="N")
+    group.add_argument("--min-special", type=int, default=0, metavar="N")
+    group.add_argument("--exclude", default="", metavar="CHARS",
+                       help="characters that must never appear")
+
+
+def constrained_policy_from_args(args, policy):
+    # None when no constraint was asked for, so the fast unconstrained path is used
+    if not (args.min_uppercase or args.min_lowercase or args.min_numbers
+            or args.min_special or args.exclude):
+        return None
+    import constraints
+    return constraints.ConstrainedPolicy.from_policy(
+        policy,
+        min_uppercase=args.min_uppercase,
+        min_lowercase=args.min_lowercase,
+        min_numbers=args.min_numbers,
+        min_special=args.min_special,
+        forbidden=args.exclude)
+
+
+def policy_from_args(args):
+    return generator.Policy(
+        uppercase=args.uppercase,
+        lowercase=args.lowercase,
+        numbers=args.numbers,
+        special=args.special,
+        avoid_similar=args.avoid_similar)
+
+
+def length_type(value):
+    length = int(value)
+    if not generator.MIN_LENGTH <= length <= generator.MAX_LENGTH:
+        raise argparse.ArgumentTypeError(
+            f"length must be between {generator.MIN_LENGTH} and {generator.MAX_LENGTH}")
+    return length
+
+
+def write_chunks(chunks, output):
+    if output in (None, "-"):
+        out = sys.stdout.buffer
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
+    else:
+        # Works for regular files and named pipes alike
+        with open(output, "wb", buffering=WRITE_BUFFER) as out:
+            for chunk in chunks:
+                out.write(chunk)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="password-generator",
+        description="Generate passwords without starting the GUI.",
+        epilog=f"other commands: {', '.join(COMMANDS)} (run '<command> --help')")
+    parser.add_argument("-n", "--count", type=int, default=1,
+                        help="number of passwords to generate (default: 1)")
+    parser.add_argument("-l", "--length", type=length_type, default=16,
+                        help="password length, 8-256 (default: 16)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="file or named pipe to write to (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="worker processes; 0 uses every core (default: 1)")
+    parser.add_argument("--seed",
+                        help="derive every shard from this seed for reproducible output")
+    parser.add_argument("-u", "--unique", action="store_true",
+                        help="never emit the same password twice in this run")
+    parser.add_argument("-t", "--template",
+                        help="generate from a pattern such as 'Cvcc-9999-Cvcc' instead of "
+                             "the character options; --length is ignored")
+    add_policy_arguments(parser)
+    add_constraint_arguments(parser)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        return importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    policy = policy_from_args(args)
+    if not generator.build_alphabet(policy):
+        parser.error("Please select at least one character type.")
+
+    try:
+        constrained = constrained_policy_from_args(args, policy)
+        if args.template is not None:
+            if constrained is not None or args.workers != 1 or args.seed is not None:
+                parser.error("--template cannot be combined with constraints, "
+                             "--workers or --seed.")
+            import template
+            plan = template.compile_template(args.template)
+            make_chunks = lambda n: template.iter_chunks(n, plan)
+        elif constrained is not None:
+            if args.workers != 1 or args.seed is not None:
+                parser.error("--workers and --seed cannot be combined with constraints.")
+            import constraints
+            constrained.plan(args.length)
+            make_chunks = lambda n: constraints.iter_chunks(n, args.length, constrained)
+        else:
+            make_chunks = lambda n: parallel.iter_chunks(n, args.length, policy,
+                                                         workers=args.workers or None,
+                                                         seed=args.seed)
+
+        if args.unique:
+            if args.seed is not None:
+                parser.error("--unique cannot be combined with --seed.")
+            import history
+            chunks = history.iter_unique_chunks(args.count, make_chunks)
+        else:
+            chunks = make_chunks(args.count)
+        write_chunks(chunks, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    except BrokenPipeError:
+        # Downstream consumer (e.g. `head`) went away; not an error for us
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,220 @@
+import math
+import os
+from bisect import bisect_right
+from collections import namedtuple
+from functools import lru_cache
+
+import generator
+
+# _LIMITS[n]: bytes below this map onto range(n) without modulo bias
+_LIMITS = [0] + [256 - 256 % n for n in range(1, 257)]
+
+
+class _RandomStream:
+    # Serves small unbiased draws out of one large os.urandom buffer, so a
+    # password costs no system calls of its own
+
+    def __init__(self, size=1 << 16):
+        self.size = size
+        self._buffer = b""
+        self._pos = 0
+
+    def take(self, count):
+        if self._pos + count > len(self._buffer):
+            self._buffer = os.urandom(max(self.size, count))
+            self._pos = 0
+        chunk = self._buffer[self._pos:self._pos + count]
+        self._pos += count
+        return chunk
+
+    def randbelow(self, n):
+        bits = n.bit_length()
+        size = (bits + 7) // 8
+        shift = size * 8 - bits
+        while True:
+            value = int.from_bytes(self.take(size), "little") >> shift
+            if value < n:
+                return value
+
+    def shuffle(self, items):
+        # Fisher-Yates with byte-sized rejection sampling (lengths <= 256)
+        j = len(items) - 1
+        while j > 0:
+            for b in self.take(2 * j):
+                n = j + 1
+                if b < _LIMITS[n]:
+                    k = b % n
+                    items[j], items[k] = items[k], items[j]
+                    j -= 1
+                    if j == 0:
+                        break
+
+
+class ClassRule(namedtuple("ClassRule", "chars min max")):
+    # One character class with an inclusive count range; max=None is unbounded
+    __slots__ = ()
+
+    def __new__(cls, chars, min=0, max=None):
+        return super(ClassRule, cls).__new__(cls, chars, min, max)
+
+
+class _Plan:
+    # Counting table for one (rules, length): ways[i][r] is the number of
+    # strings of length r built from classes i.. that satisfy their bounds
+
+    def __init__(self, sizes, mins, maxs, length):
+        self.sizes = sizes
+        self.mins = mins
+        self.maxs = maxs
+        self.length = length
+
+        m = len(sizes)
+        ways = [[0] * (length + 1) for _ in range(m + 1)]
+        ways[m][0] = 1
+        for i in reversed(range(m)):
+            powers = [1]
+            for _ in range(length):
+                powers.append(powers[-1] * sizes[i])
+            below = ways[i + 1]
+            for r in range(length + 1):
+                hi = r if maxs[i] is None else min(r, maxs[i])
+                ways[i][r] = sum(math.comb(r, k) * powers[k] * below[r - k]
+                                 for k in range(mins[i], hi + 1))
+        self.ways = ways
+        self.total = ways[0][length]
+        self._choices = {}
+
+    def choices(self, i, r):
+        # Cumulative weights for "class i takes k of the remaining r positions"
+        key = (i, r)
+        found = self._choices.get(key)
+        if found is None:
+            hi = r if self.maxs[i] is None else min(r, self.maxs[i])
+            ks = list(range(self.mins[i], hi + 1))
+            below = self.ways[i + 1]
+            cumulative = []
+            acc = 0
+            for k in ks:
+                acc += math.comb(r, k) * self.sizes[i] ** k * below[r - k]
+                cumulative.append(acc)
+            found = self._choices[key] = (ks, cumulative)
+        return found
+
+    def sample_counts(self, randbelow):
+        # Picks how many characters each class gets, weighted by the number of
+        # strings with that split, so the final strings are uniform
+        counts = []
+        r = self.length
+        for i in range(len(self.sizes)):
+            ks, cumulative = self.choices(i, r)
+            k = ks[bisect_right(cumulative, randbelow(cumulative[-1]))]
+            counts.append(k)
+            r -= k
+        return counts
+
+
+class ConstrainedPolicy:
+    def __init__(self, rules, forbidden=""):
+        cleaned = []
+        seen = set()
+        for rule in rules:
+            chars = "".join(dict.fromkeys(c for c in rule.chars if c not in forbidden))
+            if seen.intersection(chars):
+                raise ValueError("Character classes must not overlap.")
+            seen.update(chars)
+            if not chars:
+                if rule.min:
+                    raise ValueError("A required character class has no allowed characters.")
+                continue
+            if rule.max is not None and rule.max < rule.min:
+                raise ValueError("A class maximum is below its minimum.")
+            cleaned.append(ClassRule(chars, rule.min, rule.max))
+        if not cleaned:
+            raise ValueError("Please select at least one character type.")
+        self.rules = tuple(cleaned)
+
+    @classmethod
+    def from_policy(cls, policy, min_uppercase=0, min_lowercase=0, min_numbers=0,
+                    min_special=0, forbidden=""):
+        # The checkbox policy plus minimum counts; avoid_similar becomes a
+        # forbidden set like any other
+        if policy.avoid_similar:
+            forbidden += generator.SIMILAR
+        rules = []
+        for enabled, chars, minimum in (
+                (policy.uppercase, generator.UPPERCASE, min_uppercase),
+                (policy.lowercase, generator.LOWERCASE, min_lowercase),
+                (policy.numbers, generator.DIGITS, min_numbers),
+                (policy.special, generator.SPECIAL, min_special)):
+            if enabled:
+                rules.append(ClassRule(chars, minimum))
+        return cls(rules, forbidden)
+
+    def __eq__(self, other):
+        return isinstance(other, ConstrainedPolicy) and self.rules == other.rules
+
+    def __hash__(self):
+        return hash(self.rules)
+
+    def plan(self, length):
+        return _plan(self.rules, length)
+
+    def entropy(self, length):
+        # Exact: every valid string is equally likely
+        total = self.plan(length).total
+        return math.log2(total) if total else 0.0
+
+    def is_satisfied(self, password):
+        allowed = set()
+        for rule in self.rules:
+            count = sum(c in rule.chars for c in password)
+            if count < rule.min or (rule.max is not None and count > rule.max):
+                return False
+            allowed.update(rule.chars)
+        return allowed.issuperset(password)
+
+    def generate_batch(self, n, length):
+        if length > generator.MAX_LENGTH:
+            raise ValueError(f"Length must be at most {generator.MAX_LENGTH}.")
+        plan = self.plan(length)
+        stream = _RandomStream()
+        counts = [plan.sample_counts(stream.randbelow) for _ in range(n)]
+
+        # One bulk draw per class for the whole batch
+        pools = []
+        for i, rule in enumerate(self.rules):
+            total = sum(c[i] for c in counts)
+            pools.append(generator.sample_bytes(total, rule.chars).decode("ascii"))
+
+        offsets = [0] * len(self.rules)
+        passwords = []
+        shuffle = stream.shuffle
+        for c in counts:
+            chars = []
+            for i, k in enumerate(c):
+                chars.extend(pools[i][offsets[i]:offsets[i] + k])
+                offsets[i] += k
+            shuffle(chars)
+            passwords.append("".join(chars))
+        return passwords
+
+    def generate_password(self, length):
+        return self.generate_batch(1, length)[0]
+
+
+@lru_cache(maxsize=64)
+def _plan(rules, length):
+    plan = _Plan(tuple(len(r.chars) for r in rules), tuple(r.min for r in rules),
+                 tuple(r.max for r in rules), length)
+    if not plan.total:
+        raise ValueError(f"No {length}-character password satisfies these constraints.")
+    return plan
+
+
+def iter_chunks(count, length, policy, batch=4096):
+    # Newline-terminated bytes chunks, like parallel.iter_chunks
+    remaining = count
+    while remaining > 0:
+        n = min(batch, remaining)
+        yield ("\n".join(policy.generate_batch(n, length)) + "\n").encode("ascii")
+        remaining -= n
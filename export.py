@@ -0,0 +1,215 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from itertools import islice
+from xml.sax.saxutils import escape
+
+import generator
+
+# Usernames read, passwords generated and rows written per step; memory
+# stays bounded by one batch however long the input is
+BATCH_ROWS = 4096
+WRITE_BUFFER = 1 << 20
+
+# Fernet key used to encrypt exports when no key file is given
+EXPORT_KEY_ENV = "PASSWORD_GENERATOR_EXPORT_KEY"
+
+
+def _csv_rows(rows):
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(rows)
+    return buf.getvalue()
+
+
+def _jsonl_rows(rows):
+    dumps = json.dumps
+    return "".join([f'{{"username": {dumps(username)}, "password": {dumps(password)}}}\n'
+                    for username, password in rows])
+
+
+def _xml_rows(rows):
+    # Entries in the KeePass 2 XML import layout
+    return "".join([
+        "      <Entry>\n"
+        f"        <String><Key>Title</Key><Value>{escape(username)}</Value></String>\n"
+        f"        <String><Key>UserName</Key><Value>{escape(username)}</Value></String>\n"
+        "        <String><Key>Password</Key>"
+        f"<Value ProtectInMemory=\"True\">{escape(password)}</Value></String>\n"
+        "      </Entry>\n"
+        for username, password in rows])
+
+
+# name -> (header, rows formatter, footer)
+FORMATS = {
+    "csv": ("username,password\n", _csv_rows, ""),
+    "jsonl": ("", _jsonl_rows, ""),
+    "xml": ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            "<KeePassFile>\n  <Root>\n    <Group>\n      <Name>Generated</Name>\n",
+            _xml_rows,
+            "    </Group>\n  </Root>\n</KeePassFile>\n"),
+}
+
+# File extension -> format, for callers that pick the format from a file name
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".json": "jsonl", ".xml": "xml"}
+
+
+class EncryptedWriter:
+    # One Fernet token per line, one token per written chunk, so encryption
+    # streams as well; decrypt_file() puts the plaintext back together
+
+    def __init__(self, out, fernet):
+        self._fernet = fernet
+        self._out = out
+
+    def write(self, data):
+        if data:
+            self._out.write(self._fernet.encrypt(data) + b"\n")
+
+
+def decrypt_file(path, key, out):
+    import history
+    fernet = history.fernet_class()(key)
+    from cryptography.fernet import InvalidToken
+    with open(path, "rb") as f:
+        for token in f:
+            try:
+                out.write(fernet.decrypt(token.strip()))
+            except InvalidToken:
+                raise ValueError(f"{path}: wrong key or not an encrypted export") from None
+
+
+def iter_usernames(f):
+    # One username per line; surrounding whitespace and blank lines are dropped
+    for line in f:
+        username = line.strip()
+        if username:
+            yield username.decode("utf-8")
+
+
+def export(source, destination, fmt, make_passwords, key=None, progress=None):
+    # Pairs every username in `source` with make_passwords(n)'s passwords and
+    # streams the rows to `destination` ('-' for stdout). progress(rows, done,
+    # total) is called per batch with input bytes read so far; returning
+    # False stops the export early. Returns the number of rows written.
+    header, format_rows, footer = FORMATS[fmt]
+    fernet = None
+    if key is not None:
+        # Before the output is opened, so a bad key never leaves an empty file
+        import history
+        fernet = history.fernet_class()(key)
+    total = os.path.getsize(source)
+    rows = 0
+    with open(source, "rb") as f:
+        usernames = iter_usernames(f)
+        if destination in (None, "-"):
+            out = sys.stdout.buffer
+            close = False
+        else:
+            out = open(destination, "wb", buffering=WRITE_BUFFER)
+            close = True
+        try:
+            writer = EncryptedWriter(out, fernet) if fernet is not None else out
+            writer.write(header.encode("utf-8"))
+            while True:
+                batch = list(islice(usernames, BATCH_ROWS))
+                if not batch:
+                    break
+                passwords = make_passwords(len(batch))
+                writer.write(format_rows(zip(batch, passwords)).encode("utf-8"))
+                rows += len(batch)
+                if progress is not None and progress(rows, f.tell(), total) is False:
+                    break
+            writer.write(footer.encode("utf-8"))
+        finally:
+            if close:
+                out.close()
+            else:
+                out.flush()
+    return rows
+
+
+def read_key(path=None):
+    # Key file if given, else the environment; None means no encryption
+    if path:
+        with open(path, "rb") as f:
+            return f.read().strip()
+    key = os.environ.get(EXPORT_KEY_ENV)
+    return key.encode("ascii") if key else None
+
+
+def build_parser():
+    import cli
+    parser = argparse.ArgumentParser(
+        prog="password-generator export",
+        description="Generate a password for every username in a file and write them for "
+                    "import into a password vault ('export decrypt FILE' and "
+                    "'export keygen KEYFILE' handle encrypted exports).")
+    parser.add_argument("usernames", help="file with one username per line")
+    parser.add_argument("-o", "--output", default="-",
+                        help="file to write (default: stdout)")
+    parser.add_argument("-f", "--format", choices=sorted(FORMATS),
+                        help="output format (default: from the output extension, else csv)")
+    parser.add_argument("-l", "--length", type=cli.length_type, default=16,
+                        help="password length, 8-256 (default: 16)")
+    parser.add_argument("--key-file",
+                        help=f"encrypt with this Fernet key (default: ${EXPORT_KEY_ENV}, "
+                             "if set; needs the 'cryptography' package)")
+    cli.add_policy_arguments(parser)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "keygen":
+        parser = argparse.ArgumentParser(prog="password-generator export keygen",
+                                         description="Write a new export key")
+        parser.add_argument("keyfile", help="where to write the key")
+        args = parser.parse_args(argv[1:])
+        import history
+        try:
+            key = history.fernet_class().generate_key()
+        except RuntimeError as e:
+            parser.error(str(e))
+        fd = os.open(args.keyfile, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key + b"\n")
+        return 0
+
+    if argv and argv[0] == "decrypt":
+        parser = argparse.ArgumentParser(prog="password-generator export decrypt",
+                                         description="Decrypt an encrypted export to stdout")
+        parser.add_argument("path", help="encrypted export")
+        parser.add_argument("--key-file", help=f"Fernet key (default: ${EXPORT_KEY_ENV})")
+        args = parser.parse_args(argv[1:])
+        key = read_key(args.key_file)
+        if key is None:
+            parser.error(f"give --key-file or set {EXPORT_KEY_ENV}")
+        try:
+            decrypt_file(args.path, key, sys.stdout.buffer)
+        except (OSError, RuntimeError, ValueError) as e:
+            parser.error(str(e))
+        return 0
+
+    import cli
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    policy = cli.policy_from_args(args)
+    if not generator.build_alphabet(policy):
+        parser.error("Please select at least one character type.")
+    fmt = args.format or EXTENSIONS.get(os.path.splitext(args.output)[1].lower(), "csv")
+
+    try:
+        key = read_key(args.key_file)
+        rows = export(args.usernames, args.output, fmt,
+                      lambda n: generator.generate_batch(n, args.length, policy), key)
+    except (OSError, RuntimeError, ValueError) as e:
+        parser.error(str(e))
+    print(f"{rows} rows exported", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import os
+import random
+from collections import namedtuple
+from functools import lru_cache
+
+import metrics
+
+# Spelled out rather than taken from `string`, which drags `re` into the import
+UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LOWERCASE = "abcdefghijklmnopqrstuvwxyz"
+DIGITS = "0123456789"
+SPECIAL = "!@#$%^&*()-_=+[]{}|;:,.<>?/~"
+
+# Characters dropped when "Avoid Similar Characters" is checked
+SIMILAR = "IOlo01"
+
+MIN_LENGTH = 8
+MAX_LENGTH = 256
+
+
+class Policy(namedtuple("Policy", "uppercase lowercase numbers special avoid_similar")):
+    # Mirrors the checkboxes of the "Character Options" group
+    __slots__ = ()
+
+    def __new__(cls, uppercase=True, lowercase=True, numbers=True, special=True,
+                avoid_similar=False):
+        return super(Policy, cls).__new__(cls, bool(uppercase), bool(lowercase),
+                                          bool(numbers), bool(special),
+                                          bool(avoid_similar))
+
+
+DEFAULT_POLICY = Policy()
+
+
+@lru_cache(maxsize=None)
+def build_alphabet(policy):
+    # Only cache misses get here, so only real builds are timed
+    with metrics.timed("alphabet"):
+        return _build_alphabet(policy)
+
+
+def _build_alphabet(policy):
+    chars = ""
+
+    if policy.uppercase:
+        chars += UPPERCASE
+    if policy.lowercase:
+        chars += LOWERCASE
+    if policy.numbers:
+        chars += DIGITS
+    if policy.avoid_similar:
+        chars = "".join(c for c in chars if c not in SIMILAR)
+
+    if policy.special:
+        chars += SPECIAL
+
+    return chars
+
+
+@lru_cache(maxsize=None)
+def _sampling_table(alphabet):
+    # Byte b maps to alphabet[b % size] only below the largest multiple of
+    # size; everything above it is rejected, so there is no modulo bias
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    encoded = alphabet.encode("ascii")
+    table = bytes(encoded[b % size] for b in range(limit)) + bytes(256 - limit)
+    return table, bytes(range(limit, 256)), limit
+
+
+def sample_bytes(count, alphabet, randbytes=os.urandom):
+    with metrics.timed("sampling"):
+        table, reject, limit = _sampling_table(alphabet)
+        chunks = []
+        have = 0
+        while have < count:
+            need = count - have
+            # Oversample by the expected rejection rate so one draw usually suffices
+            draw = need * 256 // limit + need // 256 + 64
+            chunk = randbytes(draw).translate(table, reject)
+            chunks.append(chunk)
+            have += len(chunk)
+        data = b"".join(chunks)
+    return data[:count] if len(data) > count else data
+
+
+def generate_bytes(n, length, policy=DEFAULT_POLICY, randbytes=os.urandom):
+    # n passwords of `length` characters packed back to back as ASCII bytes
+    alphabet = build_alphabet(policy)
+    if not alphabet:
+        raise ValueError("Please select at least one character type.")
+    return sample_bytes(n * length, alphabet, randbytes)
+
+
+def generate_batch(n, length, policy=DEFAULT_POLICY, method="secure"):
+    alphabet = build_alphabet(policy)
+    if not alphabet:
+        raise ValueError("Please select at least one character type.")
+    if n <= 0:
+        return []
+
+    if method == "secure":
+        data = sample_bytes(n * length, alphabet).decode("ascii")
+    elif method == "random":
+        # Mersenne Twister path, kept for comparison in the benchmarks
+        data = "".join(random.choices(alphabet, k=n * length))
+    else:
+        raise ValueError(f"Unknown generation method: {method}")
+
+    metrics.count("passwords", n)
+    return [data[i:i + length] for i in range(0, n * length, length)]
+
+
+def generate_password(length, policy=DEFAULT_POLICY):
+    return generate_batch(1, length, policy)[0]
+
+
+def generate_lines(n, length, policy=DEFAULT_POLICY, randbytes=os.urandom):
+    # Newline-terminated passwords as one bytes buffer, ready to be written out
+    if n <= 0:
+        return b""
+    data = generate_bytes(n, length, policy, randbytes)
+    metrics.count("passwords", n)
+    if length > 48:
+        return b"\n".join([data[i:i + length] for i in range(0, n * length, length)]) + b"\n"
+
+    # Short passwords: fill a preallocated buffer one column at a time, which
+    # beats slicing every row once there are many more rows than columns
+    step = length + 1
+    out = bytearray(n * step)
+    for column in range(length):
+        out[column::step] = data[column::length]
+    out[length::step] = b"\n" * n
+    return bytes(out)
@@ -0,0 +1,920 @@
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                            QHBoxLayout, QLabel, QPushButton, QCheckBox, 
+                            QSlider, QLineEdit, QSpinBox, QMessageBox, QGroupBox,
+                            QFrame, QSizePolicy, QShortcut, QDockWidget, QListView,
+                            QToolButton, QFileDialog, QProgressBar)
+from PyQt5.QtCore import (Qt, QPropertyAnimation, QAbstractAnimation, QEasingCurve, QTimer,
+                          QEvent, QAbstractListModel, QModelIndex, QRectF, QObject, QThread,
+                          pyqtProperty, pyqtSignal)
+from PyQt5.QtGui import (QFont, QIcon, QPalette, QColor, QLinearGradient, QBrush, QPainter,
+                         QKeySequence, QPixmap, QClipboard)
+
+import json
+import os
+import sys
+import time
+
+import blocklist
+import export
+import generator
+import history
+import metrics
+import passphrase
+import pool
+import strength
+import template
+import theme
+
+# Strength recomputation is throttled to at most once per frame (~60 Hz)
+FRAME_INTERVAL_MS = 16
+
+# Save-dialog filters of the bulk export, by format
+EXPORT_FILTERS = {
+    "CSV (*.csv)": "csv",
+    "JSON Lines (*.jsonl)": "jsonl",
+    "KeePass XML (*.xml)": "xml",
+}
+
+# How long the copy button shows "Copied!", and how long a copied password
+# may stay on the clipboard (seconds, from the environment; 0 keeps it)
+COPY_FEEDBACK_MS = 2000
+CLIPBOARD_CLEAR_ENV = "PASSWORD_GENERATOR_CLIPBOARD_CLEAR"
+CLIPBOARD_CLEAR_SECONDS = 30
+
+
+class StyleHelper:
+    PRIMARY_COLOR = theme.get_theme().primary
+    SECONDARY_COLOR = theme.get_theme().secondary
+    TERTIARY_COLOR = theme.get_theme().tertiary
+    BACKGROUND_COLOR = theme.get_theme().background
+    SURFACE_COLOR = theme.get_theme().surface
+    TEXT_COLOR = theme.get_theme().text
+    
+    @staticmethod
+    def apply_theme(name=theme.DEFAULT_THEME):
+        # One application-level stylesheet, parsed by Qt once
+        app = QApplication.instance()
+        sheet = theme.stylesheet(name)
+        if app.styleSheet() != sheet:
+            app.setStyleSheet(sheet)
+    
+    @staticmethod
+    def set_property(widget, name, value):
+        # Switch a widget's variant: re-polishing re-matches the rules of the
+        # already-parsed application stylesheet instead of parsing a new one
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    
+    @staticmethod
+    def set_button_style(button, primary=True, accent=False):
+        if primary:
+            StyleHelper.set_property(button, "role", "accent" if accent else "primary")
+        else:
+            StyleHelper.set_property(button, "role", "outline")
+
+class PasswordStrengthMeter(QFrame):
+    TRACK_COLOR = "#EEEEEE"
+    RADIUS = 5
+    ANIMATION_MS = 200
+    
+    def __init__(self, parent=None):
+        super(PasswordStrengthMeter, self).__init__(parent)
+        self.strength = 0  # 0-100, the value being animated towards
+        self.displayed = 0  # value currently drawn
+        self.setMinimumHeight(10)
+        self.setMaximumHeight(10)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        
+        # Track and one full-width fill per band, rebuilt only on resize
+        self.pixmaps = {}
+        self.drawn = None  # (fill width, band) of the last paint
+        
+        # One timer drives every transition; retargeting reuses it
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(FRAME_INTERVAL_MS)
+        self.animation_timer.timeout.connect(self.step_animation)
+        self.animation_from = 0
+        self.animation_started = 0.0
+        self.easing = QEasingCurve(QEasingCurve.OutCubic)
+        
+        # Instrumentation: paints done, repaints skipped, time per paint
+        self.paint_count = 0
+        self.skipped_count = 0
+        self.paint_latency = metrics.LatencyHistogram()
+        
+    def setStrength(self, value):
+        if value == self.strength:
+            self.skipped_count += 1
+            return
+        self.strength = value
+        if not self.isVisible():
+            self.displayed = value
+            self.refresh()
+            return
+        self.animation_from = self.displayed
+        self.animation_started = time.perf_counter()
+        if not self.animation_timer.isActive():
+            self.animation_timer.start()
+        
+    def step_animation(self):
+        progress = (time.perf_counter() - self.animation_started) * 1000 / self.ANIMATION_MS
+        if progress >= 1:
+            self.animation_timer.stop()
+            self.displayed = self.strength
+        else:
+            eased = self.easing.valueForProgress(progress)
+            self.displayed = self.animation_from + (self.strength - self.animation_from) * eased
+        self.refresh()
+        
+    def band(self, value):
+        if value < strength.WEAK_BELOW:
+            return "weak"
+        if value < strength.MEDIUM_BELOW:
+            return "medium"
+        return "strong"
+        
+    def rendered_state(self):
+        width = int(self.width() * (self.displayed / 100)) if self.displayed > 0 else 0
+        return width, self.band(self.displayed) if width else None
+        
+    def refresh(self):
+        # Only schedule a paint when the pixels would actually change
+        if self.rendered_state() == self.drawn:
+            self.skipped_count += 1
+            return
+        self.update()
+        
+    def resizeEvent(self, event):
+        self.pixmaps.clear()
+        self.drawn = None
+        super().resizeEvent(event)
+        
+    def pixmap(self, key):
+        pixmap = self.pixmaps.get(key)
+        if pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            color = self.TRACK_COLOR if key == "track" else getattr(theme.get_theme(), key)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(self.rect(), self.RADIUS, self.RADIUS)
+            painter.end()
+            self.pixmaps[key] = pixmap
+        return pixmap
+        
+    def paintEvent(self, event):
+        started = time.perf_counter()
+        width, band = self.rendered_state()
+        height = self.height()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmap("track"))
+        
+        if band is not None:
+            # The fill is the left part of the full-width rounded rect plus its
+            # rounded right end, which is what a rounded rect of `width` looks like
+            fill = self.pixmap(band)
+            ratio = fill.devicePixelRatio()  # source rects are in device pixels
+            cap = min(self.RADIUS, width // 2)
+            body = width - cap
+            painter.drawPixmap(QRectF(0, 0, body, height), fill,
+                               QRectF(0, 0, body * ratio, height * ratio))
+            painter.drawPixmap(QRectF(body, 0, cap, height), fill,
+                               QRectF((self.width() - cap) * ratio, 0, cap * ratio, height * ratio))
+        painter.end()
+        
+        self.drawn = (width, band)
+        self.paint_count += 1
+        self.paint_latency.record(time.perf_counter() - started)
+
+class CustomAnimation(QPropertyAnimation):
+    def __init__(self, target, prop, duration=300):
+        super(CustomAnimation, self).__init__(target, prop)
+        self.setDuration(duration)
+        self.setEasingCurve(QEasingCurve.OutCubic)
+        
+    def replay(self):
+        # Restarting a fade that is still running would just flicker, so when
+        # triggered in rapid succession skip straight to the final frame
+        if self.state() == QAbstractAnimation.Running:
+            self.stop()
+            self.targetObject().setProperty(bytes(self.propertyName()).decode(), self.endValue())
+            return
+        self.start()
+
+class PasswordField(QLineEdit):
+    # Text colour as an animatable property: QPropertyAnimation interpolates
+    # QColor numerically, so a fade never touches the stylesheet
+    def getTextColor(self):
+        return self.palette().color(QPalette.Text)
+        
+    def setTextColor(self, color):
+        palette = self.palette()
+        palette.setColor(QPalette.Text, color)
+        self.setPalette(palette)
+        
+    textColor = pyqtProperty(QColor, getTextColor, setTextColor)
+
+class HistoryModel(QAbstractListModel):
+    # Read-only view over a PasswordHistory, newest first; Qt only asks for the
+    # rows it is about to draw, so no per-entry items are kept
+    def __init__(self, store, parent=None):
+        super(HistoryModel, self).__init__(parent)
+        self.store = store
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if role in (Qt.DisplayRole, Qt.ToolTipRole) and index.isValid():
+            return self.store[len(self.store) - 1 - index.row()]
+        return None
+        
+    def append(self, password):
+        full = len(self.store) >= self.store.limit
+        if full:
+            self.beginResetModel()
+        else:
+            self.beginInsertRows(QModelIndex(), 0, 0)
+        new = self.store.append(password)
+        if full:
+            self.endResetModel()
+        else:
+            self.endInsertRows()
+        return new
+
+class ClipboardManager(QObject):
+    # Copies passwords and takes them back off the clipboard later. Both
+    # deadlines (button feedback and auto-clear) share one reusable timer, so
+    # rapid copying only moves deadlines instead of piling up timers.
+    reset = pyqtSignal()    # the "Copied!" feedback should end
+    cleared = pyqtSignal()  # our password was removed from the clipboard
+    
+    def __init__(self, clear_after_ms=None, parent=None):
+        super(ClipboardManager, self).__init__(parent)
+        if clear_after_ms is None:
+            seconds = os.environ.get(CLIPBOARD_CLEAR_ENV)
+            clear_after_ms = int(float(seconds) * 1000) if seconds else CLIPBOARD_CLEAR_SECONDS * 1000
+        self.clear_after_ms = clear_after_ms
+        self.clipboard = QApplication.clipboard()
+        self.secret = None
+        self.reset_at = None
+        self.clear_at = None
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.on_timeout)
+        
+    def copy(self, text):
+        self.clipboard.setText(text, QClipboard.Clipboard)
+        self.secret = text
+        now = time.monotonic()
+        self.reset_at = now + COPY_FEEDBACK_MS / 1000
+        self.clear_at = now + self.clear_after_ms / 1000 if self.clear_after_ms > 0 else None
+        self.schedule()
+        
+    def copy_batch(self, passwords):
+        # One clipboard write for the whole batch, one entry per line
+        self.copy("\n".join(passwords) + "\n")
+        
+    def cancel_feedback(self):
+        if self.reset_at is not None:
+            self.reset_at = None
+            self.reset.emit()
+            self.schedule()
+        
+    def clear_if_ours(self):
+        # Leave the clipboard alone if the user has copied something else since
+        if self.secret is not None and self.clipboard.text(QClipboard.Clipboard) == self.secret:
+            self.clipboard.clear(QClipboard.Clipboard)
+            self.cleared.emit()
+        self.secret = None
+        self.clear_at = None
+        self.schedule()
+        
+    def schedule(self):
+        deadlines = [t for t in (self.reset_at, self.clear_at) if t is not None]
+        if not deadlines:
+            self.timer.stop()
+            return
+        self.timer.start(max(0, int((min(deadlines) - time.monotonic()) * 1000)))
+        
+    def on_timeout(self):
+        now = time.monotonic()
+        if self.reset_at is not None and self.reset_at <= now:
+            self.reset_at = None
+            self.reset.emit()
+        if self.clear_at is not None and self.clear_at <= now:
+            self.clear_if_ours()
+        else:
+            self.schedule()
+
+class ExportWorker(QThread):
+    # Runs export.export() off the GUI thread; signals arrive queued on it
+    progress = pyqtSignal(int)  # percent of the username file read
+    done = pyqtSignal(int)      # rows written, or -1 when cancelled
+    failed = pyqtSignal(str)
+    
+    def __init__(self, source, destination, fmt, make_passwords, key, parent=None):
+        super(ExportWorker, self).__init__(parent)
+        self.source = source
+        self.destination = destination
+        self.fmt = fmt
+        self.make_passwords = make_passwords
+        self.key = key
+        self.cancelled = False
+        
+    def run(self):
+        try:
+            rows = export.export(self.source, self.destination, self.fmt,
+                                 self.make_passwords, self.key, self.report)
+            if self.cancelled:
+                # Do not leave half an export of live credentials behind
+                os.remove(self.destination)
+                rows = -1
+        except (OSError, RuntimeError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        self.done.emit(rows)
+        
+    def report(self, rows, done, total):
+        self.progress.emit(done * 100 // total if total else 100)
+        return not self.cancelled
+
+class PasswordGenerator(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        
+        # Recompute/restyle counts, reset at the start of every slider drag
+        self.ui_counters = {"strength_recompute": 0, "label_restyle": 0}
+        self.strength_band = None
+        self.password_breached = False
+        
+        # Single-shot timer coalescing length changes into one update per frame
+        self.strength_timer = QTimer(self)
+        self.strength_timer.setSingleShot(True)
+        self.strength_timer.setInterval(FRAME_INTERVAL_MS)
+        self.strength_timer.timeout.connect(self.update_strength_meter)
+        
+        # Optional background pool for rapid-fire generation, and the time from
+        # each click until the new password is painted
+        self.password_pool = None
+        self.wordlist = None
+        self.click_latency = metrics.LatencyHistogram()
+        self.click_started = None
+        
+        # Optional breached-password blocklist; opening it is a single mmap
+        try:
+            self.blocklist = blocklist.open_default()
+            blocklist_error = None
+        except (OSError, ValueError) as e:
+            self.blocklist = None
+            blocklist_error = e
+        
+        self.initUI()
+        if blocklist_error is not None:
+            self.statusBar().showMessage(f'Blocklist not loaded: {blocklist_error}')
+        
+    def initUI(self):
+        self.setWindowTitle('Password Generator')
+        self.setGeometry(300, 300, 550, 500)
+        StyleHelper.apply_theme()
+        
+        # Create central widget and layout
+        central_widget = QWidget()
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+        self.setCentralWidget(central_widget)
+        
+        # App title
+        title_label = QLabel("Secure Password Generator")
+        title_label.setFont(QFont("Arial", 18, QFont.Bold))
+        title_label.setObjectName("title")
+        title_label.setAlignment(Qt.AlignCenter)
+        main_layout.addWidget(title_label)
+        
+        # Password display
+        password_group = QGroupBox("Generated Password")
+        password_layout = QVBoxLayout()
+        password_layout.setContentsMargins(15, 20, 15, 15)
+        password_layout.setSpacing(10)
+        
+        self.password_field = PasswordField()
+        self.password_field.setObjectName("password")
+        self.password_field.setReadOnly(True)
+        self.password_field.setFont(QFont("Courier New", 12, QFont.Bold))
+        self.password_field.setMinimumHeight(50)
+        self.password_field.setAlignment(Qt.AlignCenter)
+        self.password_field.installEventFilter(self)
+        
+        # One reusable fade-in for every generated password
+        self.password_fade = CustomAnimation(self.password_field, b"textColor")
+        self.password_fade.setStartValue(QColor(0, 0, 0, 0))
+        self.password_fade.setEndValue(QColor(0, 0, 0, 255))
+        
+        # Password strength meter
+        self.strength_meter = PasswordStrengthMeter()
+        
+        # Label to show password strength
+        self.strength_label = QLabel("Password Strength: Medium")
+        self.strength_label.setAlignment(Qt.AlignRight)
+        self.strength_label.setObjectName("strength")
+        
+        password_buttons = QHBoxLayout()
+        password_buttons.setSpacing(10)
+        
+        self.copy_button = QPushButton("Copy to Clipboard")
+        self.copy_text = self.copy_button.text()
+        self.copy_button.setMinimumHeight(40)
+        StyleHelper.set_button_style(self.copy_button, primary=False)
+        self.copy_button.clicked.connect(self.copy_password)
+        
+        self.generate_button = QPushButton("Generate Password")
+        self.generate_button.setMinimumHeight(40)
+        StyleHelper.set_button_style(self.generate_button, accent=True)
+        self.generate_button.clicked.connect(self.generate_password)
+        
+        password_buttons.addWidget(self.copy_button)
+        password_buttons.addWidget(self.generate_button)
+        
+        password_layout.addWidget(self.password_field)
+        password_layout.addWidget(self.strength_meter)
+        password_layout.addWidget(self.strength_label)
+        password_layout.addLayout(password_buttons)
+        
+        self.rapid_mode = QCheckBox("Rapid-fire mode (pre-generate passwords in the background)")
+        self.rapid_mode.toggled.connect(self.set_rapid_mode)
+        password_layout.addWidget(self.rapid_mode)
+        
+        # Holding Enter cycles through candidates
+        for key in (Qt.Key_Return, Qt.Key_Enter):
+            QShortcut(QKeySequence(key), self, self.generate_password)
+        password_group.setLayout(password_layout)
+        main_layout.addWidget(password_group)
+        
+        # Password Length control
+        self.length_group = length_group = QGroupBox("Password Length")
+        length_layout = QVBoxLayout()
+        length_layout.setContentsMargins(15, 20, 15, 15)
+        
+        length_control = QHBoxLayout()
+        self.length_slider = QSlider(Qt.Horizontal)
+        self.length_slider.setMinimum(8)
+        self.length_slider.setMaximum(256)
+        self.length_slider.setValue(16)
+        self.length_slider.setTickPosition(QSlider.TicksBelow)
+        self.length_slider.setTickInterval(16)
+        self.length_slider.valueChanged.connect(self.update_length_display)
+        self.length_slider.sliderPressed.connect(self.reset_ui_counters)
+        
+        self.length_spin = QSpinBox()
+        self.length_spin.setMinimum(8)
+        self.length_spin.setMaximum(256)
+        self.length_spin.setValue(16)
+        self.length_spin.valueChanged.connect(self.update_length_slider)
+        
+        # Add length labels
+        length_label_layout = QHBoxLayout()
+        min_label = QLabel("8")
+        min_label.setAlignment(Qt.AlignLeft)
+        max_label = QLabel("256")
+        max_label.setAlignment(Qt.AlignRight)
+        length_label_layout.addWidget(min_label)
+        length_label_layout.addWidget(max_label)
+        
+        length_control.addWidget(self.length_slider)
+        length_control.addWidget(self.length_spin)
+        
+        length_layout.addLayout(length_control)
+        length_layout.addLayout(length_label_layout)
+        length_group.setLayout(length_layout)
+        main_layout.addWidget(length_group)
+        
+        # Character options
+        self.char_group = char_group = QGroupBox("Character Options")
+        char_layout = QVBoxLayout()
+        char_layout.setContentsMargins(15, 20, 15, 15)
+        char_layout.setSpacing(10)
+        
+        self.use_uppercase = QCheckBox("Include Uppercase Letters (A-Z)")
+        self.use_uppercase.setChecked(True)
+        
+        self.use_lowercase = QCheckBox("Include Lowercase Letters (a-z)")
+        self.use_lowercase.setChecked(True)
+        
+        self.use_numbers = QCheckBox("Include Numbers (0-9)")
+        self.use_numbers.setChecked(True)
+        
+        self.use_special = QCheckBox("Include Special Characters (!@#$%^&*)")
+        self.use_special.setChecked(True)
+        
+        self.avoid_similar = QCheckBox("Avoid Similar Characters (l, 1, I, 0, O)")
+        
+        # Entropy depends on the selected classes, so keep the meter in sync
+        for checkbox in (self.use_uppercase, self.use_lowercase, self.use_numbers,
+                         self.use_special, self.avoid_similar):
+            checkbox.toggled.connect(self.update_strength_meter)
+            checkbox.toggled.connect(self.invalidate_pool)
+        
+        char_layout.addWidget(self.use_uppercase)
+        char_layout.addWidget(self.use_lowercase)
+        char_layout.addWidget(self.use_numbers)
+        char_layout.addWidget(self.use_special)
+        char_layout.addWidget(self.avoid_similar)
+        
+        # Pattern template as an alternative to the checkboxes above
+        self.use_template = QCheckBox("Use a pattern template instead")
+        self.use_template.toggled.connect(self.set_template_mode)
+        self.template_field = QLineEdit("Cvcc-9999-Cvcc")
+        self.template_field.setToolTip(template.HELP)
+        self.template_field.setEnabled(False)
+        self.template_field.textChanged.connect(self.schedule_strength_update)
+        
+        char_layout.addWidget(self.use_template)
+        char_layout.addWidget(self.template_field)
+        char_group.setLayout(char_layout)
+        main_layout.addWidget(char_group)
+        
+        # Passphrase options
+        passphrase_group = QGroupBox("Passphrase Options")
+        passphrase_layout = QVBoxLayout()
+        passphrase_layout.setContentsMargins(15, 20, 15, 15)
+        passphrase_layout.setSpacing(10)
+        
+        self.use_passphrase = QCheckBox("Generate a passphrase of random words instead")
+        self.use_passphrase.toggled.connect(self.set_passphrase_mode)
+        
+        passphrase_control = QHBoxLayout()
+        self.word_count = QSpinBox()
+        self.word_count.setMinimum(passphrase.MIN_WORDS)
+        self.word_count.setMaximum(passphrase.MAX_WORDS)
+        self.word_count.setValue(passphrase.DEFAULT_WORDS)
+        self.word_count.valueChanged.connect(self.schedule_strength_update)
+        
+        self.separator_field = QLineEdit(passphrase.DEFAULT_SEPARATOR)
+        self.separator_field.setMaxLength(3)
+        self.separator_field.setMaximumWidth(60)
+        
+        passphrase_control.addWidget(QLabel("Words"))
+        passphrase_control.addWidget(self.word_count)
+        passphrase_control.addStretch()
+        passphrase_control.addWidget(QLabel("Separator"))
+        passphrase_control.addWidget(self.separator_field)
+        
+        passphrase_layout.addWidget(self.use_passphrase)
+        passphrase_layout.addLayout(passphrase_control)
+        passphrase_group.setLayout(passphrase_layout)
+        main_layout.addWidget(passphrase_group)
+        
+        # Session history, in a dock toggled from the status bar
+        try:
+            log = history.open_log_from_env()
+        except RuntimeError as e:
+            log = None
+            QMessageBox.warning(self, "Warning", f"History log disabled: {e}")
+        self.history = HistoryModel(history.PasswordHistory(log=log), self)
+        history_view = QListView()
+        history_view.setModel(self.history)
+        history_view.setUniformItemSizes(True)
+        history_view.setFont(QFont("Courier New", 10))
+        history_view.setMinimumWidth(220)
+        history_view.doubleClicked.connect(self.restore_from_history)
+        copy_all_button = QPushButton("Copy All")
+        StyleHelper.set_button_style(copy_all_button, primary=False)
+        copy_all_button.clicked.connect(self.copy_history)
+        history_panel = QWidget()
+        history_layout = QVBoxLayout(history_panel)
+        history_layout.setContentsMargins(5, 5, 5, 5)
+        history_layout.addWidget(history_view)
+        history_layout.addWidget(copy_all_button)
+        self.history_dock = QDockWidget("History", self)
+        self.history_dock.setWidget(history_panel)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.history_dock)
+        self.history_dock.hide()
+        history_button = QToolButton()
+        history_button.setDefaultAction(self.history_dock.toggleViewAction())
+        self.statusBar().addPermanentWidget(history_button)
+        
+        # Bulk export, run on a worker thread with its progress in the status bar
+        self.export_worker = None
+        self.export_progress = QProgressBar()
+        self.export_progress.setMaximumWidth(150)
+        self.export_progress.hide()
+        self.export_button = QToolButton()
+        self.export_button.setText("Bulk Export")
+        self.export_button.clicked.connect(self.bulk_export)
+        self.statusBar().addPermanentWidget(self.export_progress)
+        self.statusBar().addPermanentWidget(self.export_button)
+        
+        # Copies go through one manager that also takes them back off the clipboard
+        self.clipboard = ClipboardManager(parent=self)
+        self.clipboard.reset.connect(self.reset_copy_button)
+        self.clipboard.cleared.connect(
+            lambda: self.statusBar().showMessage('Clipboard cleared', 3000))
+        
+        self.statusBar().showMessage('Ready')
+        
+        # Generate initial password
+        self.generate_password()
+        
+    def update_length_display(self, value):
+        # Sync the spinbox without letting it echo the value back to the slider
+        self.length_spin.blockSignals(True)
+        self.length_spin.setValue(value)
+        self.length_spin.blockSignals(False)
+        self.invalidate_pool()
+        self.schedule_strength_update()
+        
+    def update_length_slider(self, value):
+        self.length_slider.blockSignals(True)
+        self.length_slider.setValue(value)
+        self.length_slider.blockSignals(False)
+        self.invalidate_pool()
+        self.schedule_strength_update()
+        
+    def schedule_strength_update(self):
+        # Not restarted while pending, so a drag updates at most once per frame
+        if not self.strength_timer.isActive():
+            self.strength_timer.start()
+        
+    def set_passphrase_mode(self, enabled):
+        if enabled and self.wordlist is None:
+            # Opening a compiled wordlist is a single mmap, so do it on demand
+            path = passphrase.default_wordlist_path()
+            try:
+                self.wordlist = passphrase.Wordlist(path)
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(
+                    self, "Warning",
+                    f"Cannot open the passphrase wordlist {path}: {e}\n\n"
+                    f"Build one with 'main.py passphrase compile WORDS.txt {path}'.")
+                self.use_passphrase.setChecked(False)
+                return
+        
+        self.update_mode_controls()
+        self.update_strength_meter()
+        
+    def passphrase_mode(self):
+        return self.use_passphrase.isChecked() and self.wordlist is not None
+        
+    def set_template_mode(self, enabled):
+        self.update_mode_controls()
+        self.update_strength_meter()
+        
+    def template_mode(self):
+        return self.use_template.isChecked() and not self.passphrase_mode()
+        
+    def update_mode_controls(self):
+        # Grey out whatever the active mode ignores
+        passphrase_mode = self.passphrase_mode()
+        template_mode = self.template_mode()
+        self.length_group.setEnabled(not passphrase_mode and not template_mode)
+        self.char_group.setEnabled(not passphrase_mode)
+        for checkbox in (self.use_uppercase, self.use_lowercase, self.use_numbers,
+                         self.use_special, self.avoid_similar):
+            checkbox.setEnabled(not template_mode)
+        self.template_field.setEnabled(template_mode)
+        
+    def password_source(self):
+        # make_passwords(n) for the current mode, as used by the bulk export
+        if self.passphrase_mode():
+            words, wordlist = self.word_count.value(), self.wordlist
+            separator = self.separator_field.text()
+            return lambda n: passphrase.generate_batch(n, words, wordlist, separator)
+        if self.template_mode():
+            return template.compile_template(self.template_field.text()).generate_batch
+        length, policy = self.length_slider.value(), self.current_policy()
+        if not generator.build_alphabet(policy):
+            raise ValueError("Please select at least one character type.")
+        return lambda n: generator.generate_batch(n, length, policy)
+        
+    def bulk_export(self):
+        if self.export_worker is not None:
+            self.export_worker.cancelled = True
+            return
+        
+        try:
+            make_passwords = self.password_source()
+            key = export.read_key()
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Warning", str(e))
+            return
+        source, _ = QFileDialog.getOpenFileName(
+            self, "Usernames (one per line)", "", "Text files (*.txt);;All files (*)")
+        if not source:
+            return
+        destination, chosen = QFileDialog.getSaveFileName(
+            self, "Export passwords", "", ";;".join(EXPORT_FILTERS))
+        if not destination:
+            return
+        fmt = export.EXTENSIONS.get(os.path.splitext(destination)[1].lower())
+        if fmt is None:
+            fmt = EXPORT_FILTERS.get(chosen, "csv")
+            destination += "." + fmt
+        
+        self.export_worker = ExportWorker(source, destination, fmt, make_passwords, key, self)
+        self.export_worker.progress.connect(self.export_progress.setValue)
+        self.export_worker.done.connect(self.export_finished)
+        self.export_worker.failed.connect(self.export_failed)
+        self.export_worker.finished.connect(self.export_cleanup)
+        self.export_progress.setValue(0)
+        self.export_progress.show()
+        self.export_button.setText("Cancel Export")
+        encrypted = " (encrypted)" if key is not None else ""
+        self.statusBar().showMessage(f'Exporting {os.path.basename(destination)}{encrypted}...')
+        self.export_worker.start()
+        
+    def export_finished(self, rows):
+        if rows < 0:
+            self.statusBar().showMessage('Export cancelled', 3000)
+        else:
+            self.statusBar().showMessage(f'Exported {rows} passwords', 5000)
+        
+    def export_failed(self, message):
+        self.statusBar().clearMessage()
+        QMessageBox.warning(self, "Warning", f"Export failed: {message}")
+        
+    def export_cleanup(self):
+        self.export_worker.deleteLater()
+        self.export_worker = None
+        self.export_progress.hide()
+        self.export_button.setText("Bulk Export")
+        
+    def set_rapid_mode(self, enabled):
+        if enabled and self.password_pool is None:
+            self.password_pool = pool.PasswordPool()
+            self.invalidate_pool()
+        elif not enabled and self.password_pool is not None:
+            self.password_pool.close()
+            self.password_pool = None
+        
+    def invalidate_pool(self):
+        # The pool only holds passwords for the current settings
+        if self.password_pool is not None:
+            self.password_pool.configure(self.length_slider.value(), self.current_policy())
+        
+    def eventFilter(self, obj, event):
+        if (obj is self.password_field and event.type() == QEvent.Paint
+                and self.click_started is not None):
+            self.click_latency.record(time.perf_counter() - self.click_started)
+            self.click_started = None
+        return super().eventFilter(obj, event)
+        
+    def restore_from_history(self, index):
+        self.show_password(self.history.data(index))
+        self.update_strength_meter()
+        
+    def show_password(self, password):
+        self.password_field.setText(password)
+        self.password_breached = self.blocklist is not None and password in self.blocklist
+        
+    def closeEvent(self, event):
+        if metrics.is_enabled():
+            # Profiling run (PASSWORD_GENERATOR_PROFILE set): dump what was timed
+            report = metrics.report()
+            report["stages"]["click_to_paint"] = self.click_latency.summary()
+            report["stages"]["meter_paint"] = self.strength_meter.paint_latency.summary()
+            report["counters"].update(self.ui_counters)
+            report["counters"]["meter_paint"] = self.strength_meter.paint_count
+            report["counters"]["meter_paint_skipped"] = self.strength_meter.skipped_count
+            print(json.dumps(report, indent=2), file=sys.stderr)
+        if self.export_worker is not None:
+            self.export_worker.cancelled = True
+            self.export_worker.wait()
+        self.set_rapid_mode(False)
+        self.clipboard.clear_if_ours()
+        if self.history.store.log is not None:
+            self.history.store.log.close()
+        if self.blocklist is not None:
+            self.blocklist.close()
+        super().closeEvent(event)
+        
+    def reset_ui_counters(self):
+        for key in self.ui_counters:
+            self.ui_counters[key] = 0
+        
+    def update_strength_meter(self):
+        with metrics.timed("update_strength_meter"):
+            self.strength_timer.stop()
+            self.ui_counters["strength_recompute"] += 1
+            if self.password_breached:
+                # Rated by the password on display, not the settings that made it
+                result = strength.BREACHED
+            elif self.passphrase_mode():
+                result = strength.strength_from_entropy(self.wordlist.entropy(self.word_count.value()))
+            elif self.template_mode():
+                try:
+                    plan = template.compile_template(self.template_field.text())
+                except ValueError:
+                    result = strength.strength_from_entropy(0.0)
+                else:
+                    result = strength.strength_from_entropy(plan.entropy)
+            else:
+                length = self.length_slider.value()
+                result = strength.policy_strength(self.current_policy(), length)
+        
+            # Animate the strength meter
+            self.strength_meter.setStrength(result.score)
+        
+            # Update strength label; re-polishing is not free, so only on band changes
+            band = (result.band, self.password_breached)
+            if band != self.strength_band:
+                self.strength_band = band
+                self.ui_counters["label_restyle"] += 1
+                text = f"Password Strength: {result.band}"
+                if self.password_breached:
+                    text += " (on the blocklist)"
+                self.strength_label.setText(text)
+                StyleHelper.set_property(self.strength_label, "band", result.band)
+    def current_policy(self):
+        return generator.Policy(
+            uppercase=self.use_uppercase.isChecked(),
+            lowercase=self.use_lowercase.isChecked(),
+            numbers=self.use_numbers.isChecked(),
+            special=self.use_special.isChecked(),
+            avoid_similar=self.avoid_similar.isChecked())
+        
+    def reset_copy_button(self):
+        # Reset the button to its original state
+        self.copy_button.setText(self.copy_text)
+        StyleHelper.set_button_style(self.copy_button, primary=False)
+    def generate_password(self):
+        # Reset copy button to original state if it was in "copied" state
+        self.clipboard.cancel_feedback()
+        
+        self.click_started = time.perf_counter()
+        length = self.length_slider.value()
+        
+        if self.passphrase_mode():
+            words = self.word_count.value()
+            password = passphrase.generate_passphrase(words, self.wordlist,
+                                                      self.separator_field.text())
+            status = f'Generated a {words}-word passphrase'
+        elif self.template_mode():
+            try:
+                plan = template.compile_template(self.template_field.text())
+            except ValueError as e:
+                self.click_started = None
+                QMessageBox.warning(self, "Warning", str(e))
+                return
+            password = plan.generate_password()
+            status = f'Generated a {plan.length}-character password from the template'
+        else:
+            # Generate password, from the pool when rapid-fire mode has one ready
+            password = self.password_pool.pop() if self.password_pool is not None else None
+            if self.password_pool is not None:
+                metrics.count("pool_hit" if password is not None else "pool_miss")
+            if password is None:
+                try:
+                    password = generator.generate_password(length, self.current_policy())
+                except ValueError as e:
+                    self.click_started = None
+                    QMessageBox.warning(self, "Warning", str(e))
+                    return
+            status = f'Generated a {length}-character password'
+        
+        # Update UI
+        with metrics.timed("ui_update"):
+            self.show_password(password)
+            StyleHelper.set_property(self.password_field, "state", "generated")
+            
+            # Fade in animation
+            self.password_fade.replay()
+            
+            if not self.history.append(password):
+                status += ' (already generated this session!)'
+            if self.password_breached:
+                status += ' - found on the blocklist, generate another!'
+            
+            self.statusBar().showMessage(status)
+        self.update_strength_meter()
+        
+    def copy_password(self):
+        if self.password_field.text():
+            self.clipboard.copy(self.password_field.text())
+            
+            # Change button appearance to show success
+            self.copy_button.setText("✓ Copied!")
+            StyleHelper.set_property(self.copy_button, "role", "success")
+            
+            # Update status bar
+            self.statusBar().showMessage(self.copied_message('Password copied to clipboard!'), 3000)
+            
+    def copy_history(self):
+        passwords = self.history.store.recent()
+        if passwords:
+            self.clipboard.copy_batch(passwords)
+            self.statusBar().showMessage(
+                self.copied_message(f'Copied {len(passwords)} passwords to the clipboard!'), 3000)
+            
+    def copied_message(self, message):
+        if self.clipboard.clear_after_ms > 0:
+            message += f' It will be cleared in {self.clipboard.clear_after_ms / 1000:g} s.'
+        return message
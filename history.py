@@ -0,0 +1,225 @@
+import os
+import time
+from array import array
+
+# Encrypted on-disk log, enabled through the environment (see open_log_from_env)
+LOG_PATH_ENV = "PASSWORD_GENERATOR_HISTORY_LOG"
+LOG_KEY_ENV = "PASSWORD_GENERATOR_HISTORY_KEY"
+
+_MASK64 = (1 << 64) - 1
+
+
+class FingerprintSet:
+    # Open-addressing hash set of 64-bit fingerprints in one array('Q'):
+    # 8 bytes per slot at <= 50% load, so at most 16 bytes per key after a
+    # resize instead of a full Python object per key. Fingerprints come from
+    # the per-process keyed hash(), so keys must always be the same type
+    # (all str or all bytes). A 64-bit collision can only reject a new key,
+    # never let a duplicate through.
+
+    def __init__(self, capacity=1024):
+        size = 16
+        while size < capacity * 2:
+            size <<= 1
+        self._table = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, key):
+        # True when key was not seen before
+        h = hash(key) & _MASK64 or 1  # 0 marks an empty slot
+        table = self._table
+        mask = self._mask
+        i = h & mask
+        while True:
+            slot = table[i]
+            if slot == 0:
+                table[i] = h
+                self.count += 1
+                if self.count * 2 > mask:
+                    self._grow()
+                return True
+            if slot == h:
+                return False
+            i = (i + 1) & mask
+
+    def __contains__(self, key):
+        h = hash(key) & _MASK64 or 1
+        table = self._table
+        mask = self._mask
+        i = h & mask
+        while True:
+            slot = table[i]
+            if slot == 0:
+                return False
+            if slot == h:
+                return True
+            i = (i + 1) & mask
+
+    def filter_new(self, keys):
+        add = self.add
+        return [k for k in keys if add(k)]
+
+    def _grow(self):
+        old = self._table
+        size = len(old) * 2
+        table = array("Q", bytes(8 * size))
+        mask = size - 1
+        for h in old:
+            if h:
+                i = h & mask
+                while table[i]:
+                    i = (i + 1) & mask
+                table[i] = h
+        self._table = table
+        self._mask = mask
+
+    def memory_bytes(self):
+        return len(self._table) * self._table.itemsize
+
+
+class PasswordHistory:
+    # Session history packed into one bytearray plus offset and timestamp
+    # arrays: about len(password) + 12 bytes per entry, bounded by `limit`
+
+    def __init__(self, limit=1000, log=None):
+        self.limit = limit
+        self.log = log
+        self._blob = bytearray()
+        self._ends = array("I")
+        self._times = array("d")
+        self._start = 0  # entries before this index have been evicted
+        self.seen = FingerprintSet()
+
+    def __len__(self):
+        return len(self._ends) - self._start
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        i = self._start + index
+        begin = self._ends[i - 1] if i else 0
+        return self._blob[begin:self._ends[i]].decode("utf-8")
+
+    def timestamp(self, index):
+        if index < 0:
+            index += len(self)
+        return self._times[self._start + index]
+
+    def append(self, password):
+        # Returns False when this password was already generated in the session
+        new = self.seen.add(password)
+        self._blob += password.encode("utf-8")
+        self._ends.append(len(self._blob))
+        self._times.append(time.time())
+        if self.log is not None:
+            self.log.append(password)
+        if len(self) > self.limit:
+            self._evict()
+        return new
+
+    def _evict(self):
+        # Drop the oldest entries lazily; compact once half the arrays are dead
+        self._start = len(self._ends) - self.limit
+        if self._start * 2 < len(self._ends):
+            return
+        cut = self._ends[self._start - 1]
+        del self._blob[:cut]
+        self._ends = array("I", (end - cut for end in self._ends[self._start:]))
+        self._times = self._times[self._start:]
+        self._start = 0
+
+    def recent(self, n=None):
+        n = len(self) if n is None else min(n, len(self))
+        return [self[i] for i in range(len(self) - 1, len(self) - 1 - n, -1)]
+
+    def clear(self):
+        self._blob = bytearray()
+        self._ends = array("I")
+        self._times = array("d")
+        self._start = 0
+        self.seen = FingerprintSet()
+
+    def memory_bytes(self):
+        return (len(self._blob) + len(self._ends) * self._ends.itemsize
+                + len(self._times) * self._times.itemsize + self.seen.memory_bytes())
+
+
+class EncryptedLog:
+    # Append-only log: one Fernet token (AES-128-CBC + HMAC) per line. Needs
+    # the optional 'cryptography' package; the key is a Fernet key as
+    # produced by generate_key().
+
+    def __init__(self, path, key):
+        fernet = fernet_class()
+        self._fernet = fernet(key)
+        self._file = open(path, "ab", buffering=0)
+
+    @staticmethod
+    def generate_key():
+        return fernet_class().generate_key()
+
+    def append(self, password):
+        line = f"{time.time():.3f}\t{password}".encode("utf-8")
+        self._file.write(self._fernet.encrypt(line) + b"\n")
+
+    def close(self):
+        self._file.close()
+
+    @staticmethod
+    def read(path, key):
+        fernet = fernet_class()(key)
+        with open(path, "rb") as f:
+            for token in f:
+                stamp, _, password = fernet.decrypt(token.strip()).decode("utf-8").partition("\t")
+                yield float(stamp), password
+
+
+def fernet_class():
+    # Shared by every encrypted output (history log, exports)
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        raise RuntimeError(
+            "Encryption needs the 'cryptography' package "
+            "(pip install cryptography).") from None
+    return Fernet
+
+
+def open_log_from_env():
+    path = os.environ.get(LOG_PATH_ENV)
+    if not path:
+        return None
+    key = os.environ.get(LOG_KEY_ENV)
+    if not key:
+        raise RuntimeError(f"{LOG_PATH_ENV} is set but {LOG_KEY_ENV} holds no key.")
+    return EncryptedLog(path, key.encode("ascii"))
+
+
+def iter_unique_chunks(count, make_chunks, index=None):
+    # Wraps a chunk source (make_chunks(n) -> newline-terminated bytes chunks)
+    # so that no line is ever emitted twice; rejected lines are made up for
+    # with further rounds until `count` lines have gone out
+    index = FingerprintSet(count) if index is None else index
+    remaining = count
+    while remaining > 0:
+        produced = 0
+        for chunk in make_chunks(remaining):
+            lines = chunk.split(b"\n")
+            lines.pop()  # the chunk ends with a newline
+            fresh = index.filter_new(lines)
+            del fresh[remaining:]
+            if not fresh:
+                continue
+            yield chunk if len(fresh) == len(lines) else b"\n".join(fresh) + b"\n"
+            produced += len(fresh)
+            remaining -= len(fresh)
+            if not remaining:
+                return
+        if not produced:
+            raise ValueError("These settings cannot produce that many unique passwords.")
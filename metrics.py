@@ -0,0 +1,136 @@
+import math
+import os
+import threading
+import time
+
+# Stage timers and counters stay switched off unless this is set (or enable()
+# is called); off, a timed block costs one function call and a no-op `with`
+PROFILE_ENV = "PASSWORD_GENERATOR_PROFILE"
+
+
+class LatencyHistogram:
+    # Power-of-two microsecond buckets: constant memory however many samples
+
+    def __init__(self):
+        self.buckets = [0] * 32
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        us = seconds * 1e6
+        bucket = math.ceil(math.log2(us)) if us > 1 else 0
+        self.buckets[min(31, bucket)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def reset(self):
+        self.__init__()
+
+    def percentile(self, p):
+        # Upper bound (in seconds) of the bucket holding the p-th percentile
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return min((1 << i) / 1e6, self.max)
+        return self.max
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total_us": self.total * 1e6,
+            "mean_us": self.mean() * 1e6,
+            "p50_us": self.percentile(50) * 1e6,
+            "p99_us": self.percentile(99) * 1e6,
+            "max_us": self.max * 1e6,
+            "buckets_us": {1 << i: n for i, n in enumerate(self.buckets) if n},
+        }
+
+    def format(self):
+        lines = []
+        peak = max(self.buckets) or 1
+        for i, n in enumerate(self.buckets):
+            if n:
+                lines.append(f"<= {1 << i:>9} us {n:>7} {'#' * max(1, n * 40 // peak)}")
+        return "\n".join(lines)
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            self.histogram.record(elapsed)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+_lock = threading.Lock()
+_enabled = bool(os.environ.get(PROFILE_ENV))
+stages = {}
+counters = {}
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = bool(flag)
+
+
+def is_enabled():
+    return _enabled
+
+
+def timed(name):
+    # `with metrics.timed("sampling"): ...` records the block under `name`
+    if not _enabled:
+        return _NULL_TIMER
+    histogram = stages.get(name)
+    if histogram is None:
+        with _lock:
+            histogram = stages.setdefault(name, LatencyHistogram())
+    return _Timer(histogram)
+
+
+def count(name, n=1):
+    if _enabled:
+        with _lock:
+            counters[name] = counters.get(name, 0) + n
+
+
+def reset():
+    with _lock:
+        stages.clear()
+        counters.clear()
+
+
+def report():
+    with _lock:
+        return {
+            "stages": {name: histogram.summary() for name, histogram in sorted(stages.items())},
+            "counters": dict(sorted(counters.items())),
+        }
@@ -0,0 +1,59 @@
+import hashlib
+import os
+from collections import deque
+
+import generator
+
+# Output bytes per shard; each shard is one task handed to a worker
+SHARD_BYTES = 1 << 20
+
+
+class SeededStream:
+    # Deterministic CSPRNG stream: SHAKE-256 keyed by (seed, shard), one block per call
+    def __init__(self, seed, shard):
+        self.key = hashlib.sha256(f"{seed}:{shard}".encode()).digest()
+        self.counter = 0
+
+    def __call__(self, size):
+        block = hashlib.shake_256(self.key + self.counter.to_bytes(8, "little")).digest(size)
+        self.counter += 1
+        return block
+
+
+def plan_shards(count, length):
+    # Shard boundaries depend only on count and length, never on the worker
+    # count, so seeded runs produce identical output on any machine
+    per_shard = max(1, SHARD_BYTES // (length + 1))
+    for index, start in enumerate(range(0, count, per_shard)):
+        yield index, min(per_shard, count - start)
+
+
+def _generate_shard(task):
+    index, n, length, policy, seed = task
+    randbytes = os.urandom if seed is None else SeededStream(seed, index)
+    return generator.generate_lines(n, length, policy, randbytes)
+
+
+def iter_chunks(count, length, policy=generator.DEFAULT_POLICY, workers=None, seed=None):
+    if not generator.build_alphabet(policy):
+        raise ValueError("Please select at least one character type.")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        # No point paying for a pool with a single worker
+        for index, n in plan_shards(count, length):
+            yield _generate_shard((index, n, length, policy, seed))
+        return
+
+    # Imported here: the process pool machinery is the bulk of this module's import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Keep a bounded window of shards in flight and yield them in order, so
+    # memory stays constant however slow the consumer is
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for index, n in plan_shards(count, length):
+            pending.append(pool.submit(_generate_shard, (index, n, length, policy, seed)))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,162 @@
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+
+# Compiled wordlist layout (all integers little-endian uint32):
+#   MAGIC | count | offsets[count + 1] | UTF-8 words back to back
+# Word i is blob[offsets[i]:offsets[i + 1]], so a lookup is two integer reads
+# and one slice of the memory map, and opening a list costs one mmap call.
+MAGIC = b"PWWL\x01\x00\x00\x00"
+_COUNT = struct.Struct("<I")
+_SPAN = struct.Struct("<II")
+HEADER_SIZE = len(MAGIC) + _COUNT.size
+
+MIN_WORDS = 3
+MAX_WORDS = 20
+DEFAULT_WORDS = 6
+DEFAULT_SEPARATOR = "-"
+
+# Looked up when no wordlist path is given
+WORDLIST_ENV = "PASSWORD_GENERATOR_WORDLIST"
+DEFAULT_WORDLIST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.pwwl")
+
+
+class Wordlist:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is not a compiled wordlist") from None
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compiled wordlist")
+        self.count = _COUNT.unpack_from(self._mm, len(MAGIC))[0]
+        self._blob = HEADER_SIZE + 4 * (self.count + 1)
+        self.bits_per_word = math.log2(self.count) if self.count > 1 else 0.0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError("wordlist index out of range")
+        start, end = _SPAN.unpack_from(self._mm, HEADER_SIZE + 4 * index)
+        return self._mm[self._blob + start:self._blob + end].decode("utf-8")
+
+    def entropy(self, words):
+        return words * self.bits_per_word
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def compile_wordlist(source, destination):
+    # Accepts one word per line; diceware lists ("11111<TAB>word") keep the
+    # last column. Duplicates are dropped so entropy stays exact.
+    seen = set()
+    offsets = [0]
+    blob = bytearray()
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[-1] in seen:
+                continue
+            seen.add(fields[-1])
+            blob += fields[-1].encode("utf-8")
+            offsets.append(len(blob))
+
+    count = len(offsets) - 1
+    if count < 2:
+        raise ValueError("a wordlist needs at least two distinct words")
+    with open(destination, "wb") as out:
+        out.write(MAGIC)
+        out.write(_COUNT.pack(count))
+        out.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        out.write(blob)
+    return count
+
+
+def default_wordlist_path():
+    return os.environ.get(WORDLIST_ENV) or DEFAULT_WORDLIST
+
+
+def random_indices(k, n, randbytes=os.urandom):
+    # k uniform indices below n from 32-bit draws, rejecting the biased tail
+    limit = (1 << 32) - (1 << 32) % n
+    out = []
+    while len(out) < k:
+        need = k - len(out)
+        values = memoryview(randbytes(4 * (need + need // 8 + 4))).cast("I")
+        out.extend(v % n for v in values if v < limit)
+    del out[k:]
+    return out
+
+
+def generate_batch(n, words, wordlist, separator=DEFAULT_SEPARATOR):
+    if n <= 0:
+        return []
+    picks = [wordlist[i] for i in random_indices(n * words, len(wordlist))]
+    return [separator.join(picks[i:i + words]) for i in range(0, n * words, words)]
+
+
+def generate_passphrase(words, wordlist, separator=DEFAULT_SEPARATOR):
+    return generate_batch(1, words, wordlist, separator)[0]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="password-generator passphrase",
+        description="Generate diceware-style passphrases "
+                    "('passphrase compile SOURCE DEST' builds a wordlist).")
+    parser.add_argument("-n", "--count", type=int, default=1,
+                        help="number of passphrases to generate (default: 1)")
+    parser.add_argument("-w", "--words", type=int, default=DEFAULT_WORDS,
+                        help=f"words per passphrase (default: {DEFAULT_WORDS})")
+    parser.add_argument("-s", "--separator", default=DEFAULT_SEPARATOR,
+                        help=f"text between words (default: '{DEFAULT_SEPARATOR}')")
+    parser.add_argument("--wordlist", default=None,
+                        help=f"compiled wordlist (default: ${WORDLIST_ENV} or words.pwwl)")
+    parser.add_argument("--entropy", action="store_true",
+                        help="print the entropy per passphrase to stderr")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "compile":
+        parser = argparse.ArgumentParser(prog="password-generator passphrase compile",
+                                         description="Compile a text wordlist")
+        parser.add_argument("source", help="text file, one word per line")
+        parser.add_argument("destination", help="compiled wordlist to write")
+        args = parser.parse_args(argv[1:])
+        count = compile_wordlist(args.source, args.destination)
+        print(f"{count} words, {math.log2(count):.2f} bits per word", file=sys.stderr)
+        return 0
+
+    args = build_parser().parse_args(argv)
+    with Wordlist(args.wordlist or default_wordlist_path()) as wordlist:
+        if args.entropy:
+            print(f"{wordlist.entropy(args.words):.2f} bits", file=sys.stderr)
+        out = sys.stdout
+        remaining = args.count
+        while remaining > 0:
+            n = min(remaining, 10000)
+            out.write("\n".join(generate_batch(n, args.words, wordlist, args.separator)) + "\n")
+            remaining -= n
+        out.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+
+import generator
+
+
+class PasswordPool:
+    # Ring buffer of pre-generated passwords for one (length, policy), refilled
+    # in batches by a background thread so that pop() is O(1) on the caller's thread
+
+    def __init__(self, capacity=1024, low_water=None):
+        self.capacity = capacity
+        self.low_water = capacity // 4 if low_water is None else low_water
+        self._buffer = deque(maxlen=capacity)
+        self._cond = threading.Condition()
+        self._key = None
+        self._generation = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="password-pool", daemon=True)
+        self._thread.start()
+
+    def configure(self, length, policy):
+        # Drop everything generated for the previous settings
+        key = (length, policy) if generator.build_alphabet(policy) else None
+        with self._cond:
+            if key == self._key:
+                return
+            self._key = key
+            self._generation += 1
+            self._buffer.clear()
+            self._cond.notify()
+
+    def pop(self):
+        # Returns None when the pool is empty or unconfigured; callers then
+        # generate directly
+        with self._cond:
+            if not self._buffer:
+                self._cond.notify()
+                return None
+            password = self._buffer.popleft()
+            if len(self._buffer) <= self.low_water:
+                self._cond.notify()
+            return password
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._buffer.clear()
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (self._key is None or
+                                            len(self._buffer) > self.low_water):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                (length, policy), generation = self._key, self._generation
+                need = self.capacity - len(self._buffer)
+
+            batch = generator.generate_batch(need, length, policy)
+
+            with self._cond:
+                # Settings may have changed while we were generating
+                if generation == self._generation:
+                    self._buffer.extend(batch)
@@ -0,0 +1,88 @@
+import argparse
+import json
+import sys
+import time
+
+import metrics
+
+# Functions listed in the report when running under cProfile
+TOP_FUNCTIONS = 20
+
+
+def _top_functions(profiler, limit=TOP_FUNCTIONS):
+    import pstats
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({"function": f"{filename}:{line}({name})", "calls": calls,
+                     "tottime_us": tottime * 1e6, "cumtime_us": cumtime * 1e6})
+    rows.sort(key=lambda row: row["tottime_us"], reverse=True)
+    return rows[:limit]
+
+
+def profile_command(argv, cprofile=None):
+    # Runs the password generator CLI with every stage timer on; returns the
+    # command's exit status and the report
+    import cli
+
+    metrics.enable()
+    metrics.reset()
+    profiler = None
+    if cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        status = cli.main(argv)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        wall = time.perf_counter() - start
+        metrics.enable(False)
+
+    report = metrics.report()
+    report["command"] = argv
+    report["wall_us"] = wall * 1e6
+    if profiler is not None:
+        profiler.dump_stats(cprofile)
+        report["cprofile"] = cprofile
+        report["top_functions"] = _top_functions(profiler)
+    return status, report
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="password-generator profile",
+        description="Run a password generator command with the stage timers on and "
+                    "report where the time went as JSON. The GUI is profiled by "
+                    f"setting {metrics.PROFILE_ENV}=1; it prints the report on exit.",
+        epilog="example: profile --cprofile gen.prof -- -n 1000000 -o /dev/null")
+    parser.add_argument("--report", metavar="PATH",
+                        help="write the JSON report here (default: stderr)")
+    parser.add_argument("--cprofile", metavar="PATH",
+                        help="also run under cProfile and save the stats here; open them "
+                             "with `python -m pstats`, or snakeviz/flameprof for a flame graph")
+    parser.add_argument("command", nargs=argparse.REMAINDER,
+                        help="arguments for the command being profiled")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    status, report = profile_command(command, args.cprofile)
+
+    text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text, file=sys.stderr)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+import generator
+import strength
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_COUNT = 10000
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+class BadRequest(Exception):
+    pass
+
+
+class Batcher:
+    # Requests arriving in the same event-loop iteration are served from one
+    # CSPRNG draw per (length, policy): the flush runs via call_soon, after
+    # every request already read in this iteration has been queued
+
+    def __init__(self):
+        self._pending = {}
+        self._scheduled = False
+        self.batches = 0
+        self.requests = 0
+
+    def request(self, count, length, policy):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault((length, policy), []).append((count, future))
+        if not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        for (length, policy), waiters in pending.items():
+            data = generator.generate_bytes(sum(c for c, _ in waiters), length, policy)
+            self.batches += 1
+            self.requests += len(waiters)
+            offset = 0
+            for count, future in waiters:
+                size = count * length
+                if not future.done():
+                    future.set_result(data[offset:offset + size])
+                offset += size
+
+
+def _flag(query, name, default):
+    value = query.get(name, [None])[-1]
+    if value is None:
+        return default
+    if value.lower() in _TRUE:
+        return True
+    if value.lower() in _FALSE:
+        return False
+    raise BadRequest(f"{name} must be 0 or 1")
+
+
+def _int(query, name, default, low, high):
+    value = query.get(name, [None])[-1]
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer") from None
+    if not low <= number <= high:
+        raise BadRequest(f"{name} must be between {low} and {high}")
+    return number
+
+
+class PasswordService:
+    def __init__(self, blocklist=None):
+        self.batcher = Batcher()
+        self.blocklist = blocklist
+
+    async def handle(self, method, target):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        if url.path == "/health":
+            return 200, "text/plain", b"ok\n"
+        if method != "GET":
+            return 405, "text/plain", b"only GET is supported\n"
+        if url.path == "/password":
+            return await self.password(query)
+        if url.path == "/strength":
+            return self.strength(query)
+        return 404, "text/plain", b"not found\n"
+
+    async def password(self, query):
+        length = _int(query, "length", 16, generator.MIN_LENGTH, generator.MAX_LENGTH)
+        count = _int(query, "count", 1, 1, MAX_COUNT)
+        policy = generator.Policy(
+            uppercase=_flag(query, "uppercase", True),
+            lowercase=_flag(query, "lowercase", True),
+            numbers=_flag(query, "numbers", True),
+            special=_flag(query, "special", True),
+            avoid_similar=_flag(query, "avoid_similar", False))
+        if not generator.build_alphabet(policy):
+            raise BadRequest("Please select at least one character type.")
+
+        data = await self.batcher.request(count, length, policy)
+        if query.get("format", ["text"])[-1] == "json":
+            passwords = [data[i:i + length].decode("ascii") for i in range(0, len(data), length)]
+            result = strength.policy_strength(policy, length)
+            body = json.dumps({"passwords": passwords, "entropy": result.entropy,
+                               "band": result.band})
+            return 200, "application/json", body.encode()
+        return 200, "text/plain", b"\n".join(
+            [data[i:i + length] for i in range(0, len(data), length)]) + b"\n"
+
+    def strength(self, query):
+        password = query.get("password", [""])[-1]
+        breached = self.blocklist is not None and password in self.blocklist
+        result = strength.BREACHED if breached else strength.score_password(password)
+        body = json.dumps({"entropy": result.entropy, "score": result.score,
+                           "band": result.band, "breached": breached})
+        return 200, "application/json", body.encode()
+
+    async def serve_connection(self, reader, writer):
+        # Minimal HTTP/1.1 with keep-alive; request bodies are read and ignored
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get("content-length"):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                try:
+                    status, content_type, body = await self.handle(method, target)
+                except BadRequest as e:
+                    status, content_type, body = 400, "text/plain", f"{e}\n".encode()
+
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Cache-Control: no-store\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + body)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+
+async def start(service, host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None):
+    if unix is not None:
+        if os.path.exists(unix):
+            os.unlink(unix)
+        return await asyncio.start_unix_server(service.serve_connection, path=unix)
+    return await asyncio.start_server(service.serve_connection, host, port)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, unix=None, blocklist=None):
+    server = await start(PasswordService(blocklist), host, port, unix)
+    where = unix or "http://{}:{}".format(*server.sockets[0].getsockname()[:2])
+    print(f"Serving passwords on {where}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="password-generator serve",
+        description="Serve passwords over HTTP on localhost or a Unix socket. "
+                    "GET /password?length=16&count=1&special=0&format=json, "
+                    "GET /strength?password=..., GET /health")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"TCP port (default: {DEFAULT_PORT})")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead")
+    parser.add_argument("--blocklist", metavar="PATH",
+                        help="compiled blocklist checked by /strength "
+                             "(default: the installed blocklist, if any)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    import blocklist
+    try:
+        blocked = (blocklist.Blocklist(args.blocklist) if args.blocklist
+                   else blocklist.open_default())
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, blocked))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if blocked is not None:
+            blocked.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
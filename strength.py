@@ -0,0 +1,105 @@
+import math
+from collections import namedtuple
+
+import generator
+import metrics
+
+# Entropy (bits) that maps to a full strength meter
+FULL_STRENGTH_BITS = 128
+
+# Upper bounds of the strength bands shown under the meter; the last band is open
+WEAK_BELOW = 30
+MEDIUM_BELOW = 60
+BANDS = ("Weak", "Medium", "Strong")
+
+# Character classes recognised in externally supplied passwords
+UPPER, LOWER, DIGIT, SYMBOL, OTHER = 1, 2, 4, 8, 16
+CLASS_SIZES = {
+    UPPER: 26,
+    LOWER: 26,
+    DIGIT: 10,
+    SYMBOL: 33,   # printable ASCII punctuation plus space
+    OTHER: 128,   # anything else; a rough allowance for non-ASCII input
+}
+
+Strength = namedtuple("Strength", "entropy score band")
+
+# A password on the blocklist falls to the first guesses of any attack,
+# whatever its length and character mix
+BREACHED = Strength(0.0, 0.0, BANDS[0])
+
+ALL_POLICIES = tuple(generator.Policy(*(bool(bits >> i & 1) for i in range(5)))
+                     for bits in range(32))
+
+_policy_table = None
+
+
+def score_from_entropy(entropy):
+    return min(100.0, entropy / FULL_STRENGTH_BITS * 100)
+
+
+def band_for_score(score):
+    if score < WEAK_BELOW:
+        return BANDS[0]
+    if score < MEDIUM_BELOW:
+        return BANDS[1]
+    return BANDS[2]
+
+
+def strength_from_entropy(entropy):
+    score = score_from_entropy(entropy)
+    return Strength(entropy, score, band_for_score(score))
+
+
+def _build_policy_table():
+    # Every checkbox combination x every length up to MAX_LENGTH; a slider tick
+    # then costs one dict lookup and one tuple index
+    table = {}
+    for policy in ALL_POLICIES:
+        size = len(generator.build_alphabet(policy))
+        bits = math.log2(size) if size else 0.0
+        table[policy] = tuple(strength_from_entropy(length * bits)
+                              for length in range(generator.MAX_LENGTH + 1))
+    return table
+
+
+def policy_strength(policy, length):
+    global _policy_table
+    if _policy_table is None:
+        with metrics.timed("strength_table"):
+            _policy_table = _build_policy_table()
+    row = _policy_table[policy]
+    if 0 <= length < len(row):
+        return row[length]
+    size = len(generator.build_alphabet(policy))
+    return strength_from_entropy(length * math.log2(size) if size else 0.0)
+
+
+def _char_class(c):
+    if "A" <= c <= "Z":
+        return UPPER
+    if "a" <= c <= "z":
+        return LOWER
+    if "0" <= c <= "9":
+        return DIGIT
+    if " " <= c <= "~":
+        return SYMBOL
+    return OTHER
+
+
+def pool_size(classes):
+    return sum(size for cls, size in CLASS_SIZES.items() if classes & cls)
+
+
+def class_entropy(classes, length):
+    size = pool_size(classes)
+    return length * math.log2(size) if size else 0.0
+
+
+def score_password(password):
+    # Brute-force estimate for a password we did not generate: length times
+    # log2 of the combined size of every character class it uses
+    classes = 0
+    for c in set(password):
+        classes |= _char_class(c)
+    return strength_from_entropy(class_entropy(classes, len(password)))
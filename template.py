@@ -0,0 +1,136 @@
+import math
+from functools import lru_cache
+
+import generator
+
+VOWELS = "aeiou"
+CONSONANTS = "bcdfghjklmnpqrstvwxyz"
+
+# Single-character placeholders; anything else is a literal
+CLASSES = {
+    "C": CONSONANTS.upper(),
+    "c": CONSONANTS,
+    "V": VOWELS.upper(),
+    "v": VOWELS,
+    "L": generator.UPPERCASE,
+    "l": generator.LOWERCASE,
+    "9": generator.DIGITS,
+    "!": generator.SPECIAL,
+    "x": generator.UPPERCASE + generator.LOWERCASE + generator.DIGITS,
+    "*": generator.build_alphabet(generator.DEFAULT_POLICY),
+}
+
+HELP = ("C/c consonant, V/v vowel, L/l letter, 9 digit, ! special, x letter or digit, "
+        "* any; [a-f0-9] custom class, {n} repeats the previous item, \\ escapes")
+
+
+class TemplatePlan:
+    # Per-position alphabets of a compiled template; single-character
+    # alphabets are literals and cost no randomness
+
+    def __init__(self, text, positions):
+        self.text = text
+        self.positions = positions
+        self.length = len(positions)
+        self.entropy = sum(math.log2(len(a)) for a in positions)
+
+        # Positions grouped by alphabet, so a batch draws once per alphabet
+        groups = {}
+        for index, alphabet in enumerate(positions):
+            groups.setdefault(alphabet, []).append(index)
+        self._groups = tuple((alphabet, tuple(indexes)) for alphabet, indexes in groups.items())
+
+    def generate_lines(self, n):
+        # Newline-terminated passwords, assembled column by column with strided
+        # slice assignments: the work per batch is per position, not per password
+        if n <= 0:
+            return b""
+        step = self.length + 1
+        out = bytearray(n * step)
+        for alphabet, indexes in self._groups:
+            width = len(indexes)
+            if len(alphabet) == 1:
+                fill = alphabet.encode("ascii") * n
+                for index in indexes:
+                    out[index::step] = fill
+                continue
+            data = generator.sample_bytes(n * width, alphabet)
+            for column, index in enumerate(indexes):
+                out[index::step] = data[column::width]
+        out[self.length::step] = b"\n" * n
+        return bytes(out)
+
+    def generate_batch(self, n):
+        return self.generate_lines(n).decode("ascii").split("\n")[:-1] if n > 0 else []
+
+    def generate_password(self):
+        return self.generate_batch(1)[0]
+
+
+def _parse_class(text, i):
+    # text[i] is just past "["; returns the class characters and the index past "]"
+    chars = []
+    while i < len(text) and text[i] != "]":
+        c = text[i]
+        if c == "\\" and i + 1 < len(text):
+            i += 1
+            c = text[i]
+        if i + 2 < len(text) and text[i + 1] == "-" and text[i + 2] != "]":
+            end = text[i + 2]
+            if end < c:
+                raise ValueError(f"Bad range {c}-{end} in template.")
+            chars.extend(chr(o) for o in range(ord(c), ord(end) + 1))
+            i += 3
+            continue
+        chars.append(c)
+        i += 1
+    if i >= len(text):
+        raise ValueError("Unterminated [ in template.")
+    alphabet = "".join(dict.fromkeys(chars))
+    if not alphabet:
+        raise ValueError("Empty [] class in template.")
+    return alphabet, i + 1
+
+
+@lru_cache(maxsize=128)
+def compile_template(text):
+    positions = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c == "\\":
+            if i + 1 >= len(text):
+                raise ValueError("Template ends with a lone backslash.")
+            positions.append(text[i + 1])
+            i += 2
+        elif c == "[":
+            alphabet, i = _parse_class(text, i + 1)
+            positions.append(alphabet)
+        elif c == "{":
+            end = text.find("}", i)
+            if (end == -1 or not positions or not text[i + 1:end].isdigit()
+                    or int(text[i + 1:end]) < 1):
+                raise ValueError("Use {n} (n >= 1) after an item to repeat it.")
+            positions.extend([positions[-1]] * (int(text[i + 1:end]) - 1))
+            i = end + 1
+        else:
+            positions.append(CLASSES.get(c, c))
+            i += 1
+
+    if not positions:
+        raise ValueError("Template is empty.")
+    if len(positions) > generator.MAX_LENGTH:
+        raise ValueError(f"Template expands to more than {generator.MAX_LENGTH} characters.")
+    if not all(a.isascii() and a.isprintable() for a in positions):
+        raise ValueError("Templates may only use printable ASCII characters.")
+    return TemplatePlan(text, tuple(positions))
+
+
+def iter_chunks(count, plan, chunk_bytes=1 << 20):
+    # Newline-terminated bytes chunks, like parallel.iter_chunks
+    per_chunk = max(1, chunk_bytes // (plan.length + 1))
+    remaining = count
+    while remaining > 0:
+        n = min(per_chunk, remaining)
+        yield plan.generate_lines(n)
+        remaining -= n
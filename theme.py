@@ -0,0 +1,187 @@
+from collections import namedtuple
+from functools import lru_cache
+
+# Every stylesheet is built once per theme and applied app-wide; widgets pick
+# their variant through dynamic properties (role, band, state) instead of
+# carrying their own per-widget stylesheets.
+
+Theme = namedtuple("Theme", [
+    "primary", "secondary", "tertiary", "background", "surface", "text",
+    "primary_light", "border", "field_background", "muted",
+    "weak", "medium", "strong", "success", "success_hover", "success_pressed",
+])
+
+_themes = {
+    "light": Theme(
+        primary="#6200EE",
+        secondary="#03DAC6",
+        tertiary="#B00020",
+        background="#F5F5F5",
+        surface="#FFFFFF",
+        text="#333333",
+        primary_light="#BB86FC",
+        border="#CCCCCC",
+        field_background="#F8F8F8",
+        muted="#757575",
+        weak="#F44336",
+        medium="#FFC107",
+        strong="#4CAF50",
+        success="#4CAF50",
+        success_hover="#45a049",
+        success_pressed="#3d8b40",
+    ),
+}
+
+DEFAULT_THEME = "light"
+
+CHECK_ICON = (
+    "data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHdpZHRoPSIxNCIgaGVpZ2h0PSIxNCIgdmlld0JveD0iMCAwIDI0IDI0IiBmaWxsPSJub25lIiBzdHJva2U9IiNmZmZmZmYiIHN0cm9rZS13aWR0aD0iMyIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIiBjbGFzcz0iZmVhdGhlciBmZWF0aGVyLWNoZWNrIj48cG9seWxpbmUgcG9pbnRzPSIyMCA2IDkgMTcgNCAxMiI+PC9wb2x5bGluZT48L3N2Zz4="
+)
+
+
+def register_theme(name, theme):
+    _themes[name] = theme
+    stylesheet.cache_clear()
+
+
+def get_theme(name=DEFAULT_THEME):
+    return _themes[name]
+
+
+def theme_names():
+    return sorted(_themes)
+
+
+def _button_rules(role, color, hover, pressed, text="white", border="none"):
+    return f"""
+    QPushButton[role="{role}"] {{
+        background-color: {color};
+        color: {text};
+        border: {border};
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }}
+    QPushButton[role="{role}"]:hover {{
+        background-color: {hover};
+    }}
+    QPushButton[role="{role}"]:pressed {{
+        background-color: {pressed};
+    }}
+    """
+
+
+@lru_cache(maxsize=None)
+def stylesheet(name=DEFAULT_THEME):
+    t = _themes[name]
+    return "".join([
+        f"""
+    QMainWindow {{
+        background-color: {t.background};
+    }}
+    QLabel#title {{
+        color: {t.primary};
+    }}
+    QLabel#strength {{
+        color: {t.muted};
+        font-style: italic;
+    }}
+    QLabel#strength[band="Weak"] {{
+        color: {t.weak};
+    }}
+    QLabel#strength[band="Medium"] {{
+        color: {t.medium};
+    }}
+    QLabel#strength[band="Strong"] {{
+        color: {t.strong};
+    }}
+    """,
+        _button_rules("primary", t.primary, t.primary + "DD", t.primary + "AA"),
+        _button_rules("accent", t.secondary, t.secondary + "DD", t.secondary + "AA"),
+        _button_rules("outline", "transparent", t.primary + "11", t.primary + "22",
+                      text=t.primary, border=f"1px solid {t.primary}"),
+        _button_rules("success", t.success, t.success_hover, t.success_pressed),
+        f"""
+    QCheckBox {{
+        spacing: 8px;
+        font-size: 14px;
+    }}
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        border: 2px solid {t.primary};
+    }}
+    QCheckBox::indicator:unchecked {{
+        background-color: white;
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {t.primary};
+        image: url({CHECK_ICON});
+    }}
+    QSlider::groove:horizontal {{
+        height: 8px;
+        background: #E0E0E0;
+        border-radius: 4px;
+        margin: 0px;
+    }}
+    QSlider::handle:horizontal {{
+        background: {t.primary};
+        border: none;
+        width: 18px;
+        height: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }}
+    QSlider::sub-page:horizontal {{
+        background: {t.primary_light};
+        border-radius: 4px;
+    }}
+    QSpinBox {{
+        border: 1px solid {t.border};
+        border-radius: 4px;
+        padding: 5px;
+        background-color: white;
+    }}
+    QSpinBox::up-button, QSpinBox::down-button {{
+        width: 20px;
+        border: none;
+        background: #EEEEEE;
+    }}
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
+        background: #DDDDDD;
+    }}
+    QGroupBox {{
+        font-weight: bold;
+        border: 1px solid {t.border};
+        border-radius: 6px;
+        margin-top: 15px;
+        padding-top: 10px;
+        background-color: {t.surface};
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 10px;
+        color: {t.primary};
+    }}
+    QLineEdit#password {{
+        border: 2px solid {t.border};
+        border-radius: 6px;
+        padding: 10px;
+        background-color: {t.field_background};
+        font-family: 'Courier New';
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QLineEdit#password:focus, QLineEdit#password[state="generated"] {{
+        border: 2px solid {t.primary};
+    }}
+    QStatusBar {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {t.primary}, stop:1 {t.secondary});
+        color: white;
+        font-weight: bold;
+        padding: 5px;
+    }}
+    """,
+    ])